@@ -0,0 +1,57 @@
+# client.runs.stream 파싱(디코딩) 속도 벤치마크
+# replay_server.py 를 같은 프로세스 안에서 띄우고, langgraph_sdk 스트리밍 경로가
+# 초당 몇 개의 이벤트를 디코딩하는지 측정한다. (LLM / Agent Server 불필요)
+#
+# python bench_stream.py
+# python bench_stream.py --sse agent.sse   # 녹화 파일을 반복해서 사용
+
+import argparse
+import asyncio
+import time
+
+from langgraph_sdk import get_client
+
+from replay_server import ReplayServer, load_recording, synthetic_events
+
+
+def make_events(n: int, recording: list[bytes] | None) -> list[bytes]:
+    """``n`` events, cycling the recording if one was given"""
+    if not recording:
+        return synthetic_events(n)
+    return [recording[i % len(recording)] for i in range(n)]
+
+
+async def bench(url: str, repeat: int) -> tuple[int, float]:
+    client = get_client(url=url)
+    events = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        async for chunk in client.runs.stream(
+            None,  # Threadless run
+            "agent",
+            input={"messages": [{"role": "human", "content": "2+3이 뭐야??"}]},
+        ):
+            events += 1
+    return events, time.perf_counter() - start
+
+
+def main(args):
+    recording = load_recording(args.sse) if args.sse else None
+
+    print(f"{'events/run':>10} {'runs':>6} {'events':>8} {'sec':>8} {'events/s':>12} {'ms/run':>9}")
+    for n in args.sizes:
+        # 이벤트 수가 적을수록 HTTP 왕복 비용이 커서, 총 이벤트 수가 비슷해지도록 반복
+        repeat = max(1, args.total // n)
+        with ReplayServer(make_events(n, recording), rate=args.rate) as server:
+            asyncio.run(bench(server.url, 1))  # warm-up (커넥션 생성, import 비용 제외)
+            events, elapsed = asyncio.run(bench(server.url, repeat))
+        print(f"{n:>10} {repeat:>6} {events:>8} {elapsed:>8.3f} {events / elapsed:>12,.0f} {elapsed / repeat * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark langgraph_sdk SSE decoding against a local replay server")
+    parser.add_argument("--sse", help="녹화 파일 (없으면 합성 이벤트 사용)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])  # run당 이벤트 수
+    parser.add_argument("--total", type=int, default=20_000)  # 크기별 목표 총 이벤트 수
+    parser.add_argument("--rate", type=float, default=0)  # 0 = 무제한 (순수 디코딩 속도)
+    main(parser.parse_args())
@@ -0,0 +1,118 @@
+# 부하 테스트 (example.py의 threadless run을 N개 동시에 실행)
+# langgraph dev 로 로컬 서버를 먼저 띄운 뒤 실행
+#
+# python load_test.py --runs 50 --concurrency 10
+#
+# 측정 항목
+# - time-to-first-event : 요청 시작 ~ 첫 이벤트 수신
+# - inter-event gap     : 이벤트와 이벤트 사이 간격
+# - total run latency   : 요청 시작 ~ 스트림 종료
+# 각각 p50/p95/p99로 출력
+
+import argparse
+import asyncio
+import math
+import time
+
+from langgraph_sdk import get_client
+
+
+#-------------------------------------
+# 통계 유틸
+#-------------------------------------
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 <= p <= 100)."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(name: str, values: list[float]) -> str:
+    p50, p95, p99 = (percentile(values, p) * 1000 for p in (50, 95, 99))
+    return f"{name:<20} n={len(values):<6} p50={p50:8.1f}ms  p95={p95:8.1f}ms  p99={p99:8.1f}ms"
+
+
+#-------------------------------------
+# 단일 run (example.py와 동일한 요청)
+#-------------------------------------
+async def one_run(client, semaphore: asyncio.Semaphore, assistant: str, content: str) -> dict:
+    """Stream one threadless run and record its timings"""
+
+    async with semaphore:  # 동시에 열린 run 수 제한
+        start = time.perf_counter()
+        first_event = None
+        last_event = None
+        gaps = []
+        events = 0
+        error = None
+        try:
+            async for chunk in client.runs.stream(
+                None,  # Threadless run
+                assistant,
+                input={
+                    "messages": [{
+                        "role": "human",
+                        "content": content,
+                    }],
+                },
+            ):
+                now = time.perf_counter()
+                if first_event is None:
+                    first_event = now - start
+                else:
+                    gaps.append(now - last_event)
+                last_event = now
+                events += 1
+                if chunk.event == "error":
+                    error = chunk.data
+        except Exception as e:  # 연결 끊김 등도 실패 run으로 집계
+            error = repr(e)
+
+        return {
+            "ttfe": first_event,
+            "gaps": gaps,
+            "total": time.perf_counter() - start,
+            "events": events,
+            "error": error,
+        }
+
+
+#-------------------------------------
+# 부하 드라이버
+#-------------------------------------
+async def main(args):
+    # 모든 run이 하나의 client(= 하나의 httpx 커넥션 풀)를 공유
+    client = get_client(url=args.url)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    print(f"[LOAD] runs={args.runs} concurrency={args.concurrency} url={args.url}")
+    wall_start = time.perf_counter()
+    results = await asyncio.gather(
+        *(one_run(client, semaphore, args.assistant, args.content) for _ in range(args.runs))
+    )
+    wall = time.perf_counter() - wall_start
+
+    ok = [r for r in results if r["error"] is None]
+    failed = len(results) - len(ok)
+
+    print(f"\n[RESULT] 성공 {len(ok)} / 실패 {failed} / wall {wall:.2f}s / {len(ok) / wall:.2f} runs/s")
+    print(summarize("time-to-first-event", [r["ttfe"] for r in ok if r["ttfe"] is not None]))
+    print(summarize("inter-event gap", [g for r in ok for g in r["gaps"]]))
+    print(summarize("total run latency", [r["total"] for r in ok]))
+
+    if failed:
+        print("\n[ERRORS] (최대 5개)")
+        for r in [r for r in results if r["error"] is not None][:5]:
+            print(f" - {r['error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent load driver for the local Agent Server")
+    parser.add_argument("--url", default="http://localhost:2024")
+    parser.add_argument("--assistant", default="agent")  # langgraph.json에 정의된 이름
+    parser.add_argument("--runs", type=int, default=20)  # 전체 run 수 (N)
+    parser.add_argument("--concurrency", type=int, default=5)  # 동시에 열린 run 수 상한
+    parser.add_argument("--content", default="2+3이 뭐야??")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,177 @@
+# localhost:2024 (langgraph dev) 대역 서버
+# 실제 Agent Server / LLM 없이, 녹화해 둔 SSE 이벤트 스트림을 그대로 다시 흘려보낸다.
+#
+# 1) 녹화 (langgraph dev 실행 중일 때)
+#    python replay_server.py record --out agent.sse
+# 2) 재생
+#    python replay_server.py serve --sse agent.sse --port 2025 --rate 50
+#    -> example.py / load_test.py 의 url을 http://localhost:2025 로 바꿔서 실행
+#
+# rate = 초당 이벤트 수 (0이면 제한 없이 한 번에 전송)
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+#-------------------------------------
+# SSE 이벤트 준비 (녹화 파일 / 합성)
+#-------------------------------------
+def encode_event(event: str, data) -> bytes:
+    """Encode one event the way the Agent Server writes it on the wire"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode()
+
+
+def load_recording(path: str) -> list[bytes]:
+    """Split a recorded ``.sse`` file into raw events (blank-line separated)"""
+    with open(path, encoding="utf-8") as f:
+        blocks = f.read().replace("\r\n", "\n").split("\n\n")
+    return [(b.strip("\n") + "\n\n").encode() for b in blocks if b.strip()]
+
+
+def synthetic_events(n: int) -> list[bytes]:
+    """``n`` events shaped like the day1 agent's threadless run
+
+    metadata 1개 + 토큰 조각 updates 이벤트 (n-1)개
+    """
+    events = [encode_event("metadata", {"run_id": "00000000-0000-0000-0000-000000000000", "attempt": 1})]
+    for i in range(n - 1):
+        events.append(encode_event("updates", {
+            "agent": {"messages": [{
+                "type": "ai",
+                "content": f"token-{i} ",
+                "id": f"run-{i}",
+                "tool_calls": [],
+            }]},
+        }))
+    return events[:n]
+
+
+#-------------------------------------
+# 재생 서버
+#-------------------------------------
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive → 클라이언트 커넥션 풀 재사용 가능
+    disable_nagle_algorithm = True  # 작은 이벤트가 40ms씩 묶여서 지연되지 않도록
+
+    def log_message(self, format, *args):  # 요청마다 찍히는 access log 끄기
+        pass
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    def do_POST(self):
+        # POST /runs/stream, POST /threads/{thread_id}/runs/stream 만 흉내낸다
+        if not self.path.split("?")[0].endswith("/runs/stream"):
+            self.send_error(404)
+            return
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))  # 요청 본문은 읽고 버림
+
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        if server.rate <= 0:
+            self._write_chunk(server.payload)  # 제한 없음: 전체를 한 번에
+        else:
+            interval = 1 / server.rate
+            start = time.perf_counter()
+            for i, event in enumerate(server.events):
+                delay = start + i * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self._write_chunk(event)
+                self.wfile.flush()
+        self._write_chunk(b"")  # 0-length chunk = 스트림 끝
+        self.wfile.flush()
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """In-process stand-in for the ``langgraph dev`` streaming endpoint
+
+    with ReplayServer(events, rate=0) as server:
+        client = get_client(url=server.url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, events: list[bytes], rate: float = 0, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), ReplayHandler)
+        self.events = events
+        self.payload = b"".join(events)
+        self.rate = rate
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+#-------------------------------------
+# 녹화 (실제 서버 응답을 .sse 파일로 저장)
+#-------------------------------------
+async def record(url: str, assistant: str, content: str, out: str):
+    from langgraph_sdk import get_client
+
+    client = get_client(url=url)
+    count = 0
+    with open(out, "w", encoding="utf-8") as f:
+        async for chunk in client.runs.stream(
+            None,  # Threadless run
+            assistant,
+            input={"messages": [{"role": "human", "content": content}]},
+        ):
+            f.write(encode_event(chunk.event, chunk.data).decode())
+            count += 1
+    print(f"[RECORD] {count}개 이벤트 저장 → {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record / replay Agent Server SSE streams")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record")
+    rec.add_argument("--url", default="http://localhost:2024")
+    rec.add_argument("--assistant", default="agent")
+    rec.add_argument("--content", default="2+3이 뭐야??")
+    rec.add_argument("--out", default="agent.sse")
+
+    serve = sub.add_parser("serve")
+    serve.add_argument("--sse", help="녹화 파일 (없으면 합성 이벤트 사용)")
+    serve.add_argument("--events", type=int, default=100)  # 합성 이벤트 수
+    serve.add_argument("--rate", type=float, default=0)  # 초당 이벤트 수, 0 = 무제한
+    serve.add_argument("--port", type=int, default=2025)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        asyncio.run(record(args.url, args.assistant, args.content, args.out))
+    else:
+        events = load_recording(args.sse) if args.sse else synthetic_events(args.events)
+        server = ReplayServer(events, rate=args.rate, port=args.port)
+        print(f"[REPLAY] {len(events)}개 이벤트 재생 중: {server.url} (Ctrl+C 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
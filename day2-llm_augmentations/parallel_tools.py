@@ -0,0 +1,171 @@
+#기본 설정
+# pip install langchain_core
+
+#-------------------------------------
+# bind_tools 결과(msg.tool_calls)를 동시에 실행하는 executor
+#-------------------------------------
+"""
+submissions에서는 보통 이렇게 도구를 하나씩 실행한다.
+
+    for tool_call in msg.tool_calls:
+        if tool_call['name'] == "make_secret_code":
+            ...
+
+도구 호출끼리 서로 독립이면 한꺼번에 실행해도 된다.
+- sync 도구  : 스레드 풀에서 실행
+- async 도구 : asyncio 이벤트 루프에서 실행
+- 도구별 timeout, 도구별 동시 실행 수 제한
+  (executor 하나를 같이 쓰는 모든 턴에 걸리는 제한. 메시지 하나 안에서만이 아님)
+- 결과 ToolMessage는 원래 tool_calls 순서 그대로 반환
+
+→ 도구 3개를 부르는 턴의 비용이 (합)이 아니라 (가장 느린 도구) 정도가 된다.
+"""
+
+import asyncio
+import inspect
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import BaseTool
+
+
+class ParallelToolExecutor:
+    """Run an AIMessage's ``tool_calls`` concurrently and return ToolMessages in order
+
+    executor = ParallelToolExecutor([make_secret_code, pick_one], timeout=10)
+    tool_messages = executor.invoke(msg)          # sync (이벤트 루프 안에서 불러도 됨)
+    tool_messages = await executor.ainvoke(msg)   # async
+
+    sync invoke는 executor 전용 백그라운드 이벤트 루프에서 실행되므로
+    여러 스레드의 invoke도 같은 도구별 제한을 공유한다.
+    """
+
+    def __init__(
+        self,
+        tools: list,
+        *,
+        max_workers: int = 8,
+        timeout: float | None = 30,
+        tool_timeouts: dict[str, float] | None = None,
+        tool_limits: dict[str, int] | None = None,
+    ):
+        # 도구 이름 → 함수(또는 @tool로 만든 BaseTool)
+        self.tools = {t.name if isinstance(t, BaseTool) else t.__name__: t for t in tools}
+        self.max_workers = max_workers
+        self.timeout = timeout  # 기본 timeout (초)
+        self.tool_timeouts = tool_timeouts or {}  # 도구별 timeout
+        self.tool_limits = tool_limits or {}  # 도구별 동시 실행 수 상한
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool")
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프마다 한 세트 (처음 쓸 때 생성)
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._loop: asyncio.AbstractEventLoop | None = None  # sync invoke용 백그라운드 루프
+        self._loop_lock = threading.Lock()
+
+    @staticmethod
+    def _is_async(tool) -> bool:
+        if isinstance(tool, BaseTool):
+            return getattr(tool, "coroutine", None) is not None
+        return inspect.iscoroutinefunction(tool)
+
+    def _semaphores_for_loop(self) -> dict[str, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = {
+                name: asyncio.Semaphore(self.tool_limits.get(name, self.max_workers)) for name in self.tools
+            }
+        return self._semaphores[loop]
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="tool-loop", daemon=True).start()
+            return self._loop
+
+    async def _run_one(self, tool_call: dict, semaphores: dict[str, asyncio.Semaphore]) -> ToolMessage:
+        name = tool_call["name"]
+        args = tool_call.get("args", {})
+        call_id = tool_call["id"]
+
+        tool = self.tools.get(name)
+        if tool is None:
+            return ToolMessage(content=f"Error: unknown tool {name!r}", name=name, tool_call_id=call_id, status="error")
+
+        timeout = self.tool_timeouts.get(name, self.timeout)
+        async with semaphores[name]:
+            try:
+                if self._is_async(tool):
+                    coro = tool.ainvoke(args) if isinstance(tool, BaseTool) else tool(**args)
+                else:
+                    loop = asyncio.get_running_loop()
+                    func = (lambda: tool.invoke(args)) if isinstance(tool, BaseTool) else (lambda: tool(**args))
+                    coro = loop.run_in_executor(self._pool, func)
+                result = await asyncio.wait_for(coro, timeout)
+            except asyncio.TimeoutError:
+                # 스레드에서 돌던 sync 도구는 멈출 수 없으므로 결과만 버린다
+                return ToolMessage(content=f"Error: {name} timed out after {timeout}s", name=name, tool_call_id=call_id, status="error")
+            except Exception as e:
+                return ToolMessage(content=f"Error: {e!r}", name=name, tool_call_id=call_id, status="error")
+
+        if isinstance(result, ToolMessage):  # BaseTool이 이미 ToolMessage를 만든 경우
+            return result
+        return ToolMessage(content=str(result), name=name, tool_call_id=call_id)
+
+    async def ainvoke(self, message: AIMessage | list[dict]) -> list[ToolMessage]:
+        tool_calls = message.tool_calls if isinstance(message, AIMessage) else message
+        semaphores = self._semaphores_for_loop()
+        # gather는 입력 순서대로 결과를 돌려주므로 원래 순서가 유지됨
+        return await asyncio.gather(*(self._run_one(c, semaphores) for c in tool_calls))
+
+    def invoke(self, message: AIMessage | list[dict]) -> list[ToolMessage]:
+        # asyncio.run은 이미 도는 루프(Jupyter, async 그래프) 안에서 RuntimeError → 백그라운드 루프에 맡기고 기다림
+        future = asyncio.run_coroutine_threadsafe(self.ainvoke(message), self._background_loop())
+        return future.result()
+
+    def close(self):
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+        self._pool.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # bjy.py의 도구들 + 느린 async 도구 (동시 실행 효과를 보기 위해 sleep 추가)
+    def make_secret_code(text: str) -> str:
+        """입력된 텍스트를 비밀 암호로 변환"""
+        time.sleep(1.0)
+        return f"SECRET_CODE[{text[::-1].replace(' ', '_')}]"
+
+    def pick_one(candidates: list[str]) -> str:
+        """주어진 목록 중에서 하나를 랜덤으로 선택합니다."""
+        time.sleep(0.8)
+        return random.choice(candidates)
+
+    async def check_weather(city: str) -> str:
+        """도시의 날씨를 알려줍니다."""
+        await asyncio.sleep(0.5)
+        return f"{city}: 맑음"
+
+    # llm_with_tools.invoke(...) 결과라고 가정
+    msg = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "make_secret_code", "args": {"text": "김 민수"}, "id": "call_1"},
+            {"name": "pick_one", "args": {"candidates": ["짜장면", "짬뽕", "볶음밥"]}, "id": "call_2"},
+            {"name": "check_weather", "args": {"city": "서울"}, "id": "call_3"},
+        ],
+    )
+
+    executor = ParallelToolExecutor([make_secret_code, pick_one, check_weather], timeout=5)
+
+    start = time.perf_counter()
+    for tool_message in executor.invoke(msg):
+        print(f"[{tool_message.tool_call_id}] {tool_message.name} → {tool_message.content}")
+    print(f"\n동시 실행: {time.perf_counter() - start:.2f}s (순차 실행이면 약 2.3s)")
+    executor.close()
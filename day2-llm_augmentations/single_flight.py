@@ -0,0 +1,135 @@
+#기본 설정
+# pip install langchain_core langchain-anthropic
+
+#-------------------------------------
+# Single-flight: 동시에 들어온 "똑같은" LLM 호출은 한 번만 보낸다
+#-------------------------------------
+"""
+같은 주제로 그래프를 여러 번 동시에 돌리면, 같은 llm.invoke(prompt)가 동시에 여러 번 나간다.
+(model, messages, params)가 같은 호출이 이미 진행 중이면
+새 요청을 보내지 않고, 먼저 보낸 호출의 결과를 같이 기다린다.
+params = invoke kwargs(stop 등) + bind()로 묶인 kwargs + 모델의 configurable 필드 값(config)
+
+- 캐시가 아님: 호출이 끝나면 바로 잊어버린다 (다음 호출은 다시 모델로 감)
+- 진행 중인 호출끼리만 합친다 → 결과가 달라질 걱정 없이 중복 비용만 줄어듦
+- async: 모델 호출은 별도 task로 한 번만 시작하고 모두(처음 부른 쪽 포함) shield로 기다림
+         → 어느 호출자가 취소돼도 다른 호출자는 영향 없음
+
+llm = SingleFlightLLM(ChatAnthropic(model="..."))
+llm.invoke(...) / await llm.ainvoke(...)   # 기존 코드 그대로 사용
+llm.stats  # {"calls": 10, "executed": 3, "coalesced": 7}
+"""
+
+import asyncio
+import json
+import threading
+import weakref
+from concurrent.futures import Future
+
+from langchain_core.load import dumpd
+from langchain_core.messages import convert_to_messages
+
+
+class SingleFlightLLM:
+    """Wrap a chat model so identical in-flight ``invoke``/``ainvoke`` calls share one request"""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.calls = 0  # 전체 호출 수
+        self.executed = 0  # 실제로 모델에 보낸 호출 수
+        self.coalesced = 0  # 진행 중인 호출에 합쳐진 수
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        # asyncio task는 이벤트 루프에 묶이므로 루프마다 따로 (루프가 사라지면 같이 정리)
+        self._ainflight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __getattr__(self, name):
+        # bind_tools, with_structured_output 등은 원래 모델 것을 그대로 사용
+        return getattr(self.llm, name)
+
+    @property
+    def stats(self) -> dict:
+        return {"calls": self.calls, "executed": self.executed, "coalesced": self.coalesced}
+
+    def _key(self, input, config, kwargs) -> str:
+        model = dumpd(self.llm)  # 모델 이름 + temperature 등 생성 파라미터
+        bound = getattr(self.llm, "kwargs", {})  # llm.bind(stop=...) 로 묶인 값
+        # config 중 결과에 영향을 주는 것은 모델의 configurable 필드뿐 (callbacks, tags 등은 제외)
+        configurable = (config or {}).get("configurable", {})
+        fields = {spec.id: configurable.get(spec.id) for spec in self.llm.config_specs}
+        messages = [dumpd(m) for m in convert_to_messages(input)] if not isinstance(input, str) else input
+        return json.dumps([model, bound, fields, messages, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+
+    def invoke(self, input, config=None, **kwargs):
+        key = self._key(input, config, kwargs)
+        with self._lock:
+            self.calls += 1
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()  # 먼저 보낸 호출이 끝날 때까지 대기
+
+        try:
+            future.set_result(self.llm.invoke(input, config, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)  # 기다리던 호출들도 같은 예외를 받음
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return future.result()
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        key = self._key(input, config, kwargs)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.calls += 1
+            inflight = self._ainflight.setdefault(loop, {})
+            task = inflight.get(key)
+            if task is None:
+                task = inflight[key] = asyncio.ensure_future(self.llm.ainvoke(input, config, **kwargs))
+                task.add_done_callback(lambda t: self._adone(inflight, key, t))
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        # shield: 기다리던 쪽(처음 부른 쪽 포함)이 취소돼도 공유 task는 계속 진행
+        return await asyncio.shield(task)
+
+    def _adone(self, inflight: dict, key: str, task: asyncio.Task):
+        with self._lock:
+            inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # 모든 호출자가 취소된 뒤 실패해도 "never retrieved" 경고가 나지 않게
+
+
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from langchain_anthropic import ChatAnthropic
+    llm = SingleFlightLLM(ChatAnthropic(model="claude-sonnet-4-5-20250929"))
+
+    # 같은 주제로 5개의 요청이 동시에 들어온 상황
+    prompt = "강아지에 대해 짧은 농담을 만들어줘"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: llm.invoke(prompt), range(5)))
+    print(f"[sync]  {time.perf_counter() - start:.2f}s {llm.stats}")
+    print(results[0].content)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(llm.ainvoke(prompt) for _ in range(5)))
+        print(f"[async] {time.perf_counter() - start:.2f}s {llm.stats}")
+
+    asyncio.run(main())
@@ -0,0 +1,177 @@
+#기본 설정
+# pip install langchain_core langchain-anthropic pydantic
+
+#-------------------------------------
+# with_structured_output 결과 캐시 (SQLite)
+#-------------------------------------
+"""
+같은 모델 + 같은 스키마 + 같은 프롬프트로 structured_llm.invoke를 다시 부르면
+모델을 다시 호출하지 않고, 저장해 둔 Pydantic 객체를 그대로 돌려준다.
+
+키   : sha256(모델 이름, 스키마 JSON, 정규화한 프롬프트)
+저장 : 로컬 SQLite 파일 (스크립트를 다시 실행해도 유지)
+만료 : ttl(초)이 지난 항목은 무시하고 삭제
+용량 : max_entries를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from pydantic import BaseModel
+
+
+def normalize_prompt(prompt) -> str:
+    """Normalize a prompt (str or list of messages) into a stable cache string"""
+
+    def norm(text: str) -> str:
+        text = unicodedata.normalize("NFC", text)  # 같은 한글이 다른 코드로 들어오는 경우 통일
+        return re.sub(r"\s+", " ", text).strip()
+
+    if isinstance(prompt, str):
+        return norm(prompt)
+
+    # [SystemMessage(...), HumanMessage(...)] 또는 [("system", "..."), ...] 형태
+    parts = []
+    for message in prompt:
+        if isinstance(message, tuple):
+            role, content = message
+        elif isinstance(message, dict):
+            role, content = message.get("role"), message.get("content")
+        else:
+            role, content = message.type, message.content
+        if not isinstance(content, str):
+            content = json.dumps(content, ensure_ascii=False, sort_keys=True)
+        parts.append([role, norm(content)])
+    return json.dumps(parts, ensure_ascii=False)
+
+
+class StructuredOutputCache:
+    """Content-addressed SQLite cache for parsed structured outputs"""
+
+    def __init__(self, path: str = "structured_cache.sqlite", ttl: float | None = 7 * 24 * 3600, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS structured_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON structured_cache(last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, schema: type[BaseModel], prompt) -> str:
+        schema_json = json.dumps(schema.model_json_schema(), sort_keys=True, ensure_ascii=False)
+        raw = json.dumps([model_name, schema_json, normalize_prompt(prompt)], ensure_ascii=False)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str, schema: type[BaseModel]) -> BaseModel | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM structured_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:  # 만료된 항목
+                self._conn.execute("DELETE FROM structured_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE structured_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return schema.model_validate_json(value)
+
+    def put(self, key: str, value: BaseModel):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO structured_cache (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value.model_dump_json(), now, now),
+            )
+            # 용량 초과분은 가장 오래 안 쓴 것부터 삭제
+            self._conn.execute(
+                """
+                DELETE FROM structured_cache WHERE key IN (
+                    SELECT key FROM structured_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM structured_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM structured_cache").fetchone()[0]
+
+
+class CachedStructuredLLM:
+    """Drop-in for ``llm.with_structured_output(schema)`` that checks the cache first
+
+    structured_llm = CachedStructuredLLM(llm, SearchQuery, cache)
+    output = structured_llm.invoke("...")  # 두 번째부터는 모델 호출 없음
+    """
+
+    def __init__(self, llm, schema: type[BaseModel], cache: StructuredOutputCache, **kwargs):
+        self.schema = schema
+        self.cache = cache
+        self.model_name = getattr(llm, "model", None) or getattr(llm, "model_name", None) or type(llm).__name__
+        self.structured_llm = llm.with_structured_output(schema, **kwargs)
+
+    def invoke(self, prompt, config=None):
+        key = self.cache.make_key(self.model_name, self.schema, prompt)
+        cached = self.cache.get(key, self.schema)
+        if cached is not None:
+            return cached
+
+        output = self.structured_llm.invoke(prompt, config)
+        if isinstance(output, BaseModel):  # 파싱 실패(None 등)는 캐시하지 않음
+            self.cache.put(key, output)
+        return output
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from pydantic import Field
+    from langchain_anthropic import ChatAnthropic
+    llm = ChatAnthropic(model="claude-sonnet-4-5-20250929")
+
+    class SearchQuery(BaseModel):
+        search_query: str = Field(None, description="Query that is optimized web search.") #웹검색에 최적화된 쿼리 텍스트
+        justification: str = Field(
+            None, description="Why this query is relevant to the user's request."
+        ) #이 쿼리가 사용자의 요청과 관련이 있는 이유
+
+    cache = StructuredOutputCache("structured_cache.sqlite", ttl=24 * 3600, max_entries=500)
+    structured_llm = CachedStructuredLLM(llm, SearchQuery, cache)
+
+    for i in range(2):  # 두 번째 호출은 캐시에서 바로 나옴
+        start = time.perf_counter()
+        output = structured_llm.invoke("칼슘 CT 점수는 고콜레스테롤과  어떤 관련이 있나요?")
+        print(f"[{i + 1}회차] {(time.perf_counter() - start) * 1000:.1f}ms \n {output}")
+
+    print(f"\n캐시 hit={cache.hits} miss={cache.misses} 저장된 항목={len(cache)}")
@@ -0,0 +1,112 @@
+#-------------------------------------
+# Batch runner: 주제 수만 개를 joke → improve → polish 체인에 돌리기
+#-------------------------------------
+"""
+python batch_runner.py topics.jsonl results.jsonl --concurrency 16
+
+입력 : JSONL ({"topic": "강아지"} 한 줄에 하나) 또는 CSV (topic 컬럼, 없으면 첫 번째 컬럼)
+출력 : 끝난 순서대로 최종 state를 한 줄씩 JSONL에 바로 기록
+재개 : 출력 파일에 이미 있는 topic은 건너뜀 (중간에 끊겨도 다시 실행하면 이어서 진행)
+실패 : results.jsonl.errors 에 따로 기록 → 다음 실행 때 다시 시도됨
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from example import chain
+
+
+def read_topics(path: str) -> list[str]:
+    """Topics from a JSONL or CSV file, in file order"""
+    topics = []
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            reader = csv.reader(f)
+            header = next(reader, [])
+            column = header.index("topic") if "topic" in header else 0
+            if "topic" not in header and header:  # 헤더가 없는 CSV
+                topics.append(header[column])
+            topics.extend(row[column] for row in reader if row)
+        else:
+            topics.extend(json.loads(line)["topic"] for line in f if line.strip())
+    return topics
+
+
+def done_topics(path: str) -> set[str]:
+    """Topics already written to the output file"""
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["topic"])
+            except (json.JSONDecodeError, KeyError):
+                pass  # 중간에 끊겨서 깨진 마지막 줄
+    return done
+
+
+def run_batch(input_path: str, output_path: str, concurrency: int = 8, report_every: int = 100):
+    topics = read_topics(input_path)
+    done = done_topics(output_path)
+    # 입력 안의 중복 topic도 한 번만 실행
+    pending = list(dict.fromkeys(t for t in topics if t not in done))
+    print(f"[BATCH] 전체 {len(topics)} / 완료됨 {len(done)} / 남은 {len(pending)} (concurrency={concurrency})")
+
+    start = time.perf_counter()
+    finished = failed = 0
+
+    with open(output_path, "a", encoding="utf-8") as out, \
+         open(output_path + ".errors", "a", encoding="utf-8") as err, \
+         ThreadPoolExecutor(max_workers=concurrency) as pool:
+
+        remaining = iter(pending)
+        in_flight = {}
+
+        def submit_next():
+            topic = next(remaining, None)
+            if topic is not None:
+                in_flight[pool.submit(chain.invoke, {"topic": topic})] = topic
+
+        # 동시에 실행 중인 주제 수를 concurrency개로 유지
+        for _ in range(concurrency):
+            submit_next()
+
+        while in_flight:
+            completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in completed:
+                topic = in_flight.pop(future)
+                try:
+                    state = future.result()
+                except Exception as e:
+                    failed += 1
+                    err.write(json.dumps({"topic": topic, "error": repr(e)}, ensure_ascii=False) + "\n")
+                    err.flush()
+                else:
+                    finished += 1
+                    out.write(json.dumps(state, ensure_ascii=False) + "\n")
+                    out.flush()  # 끝난 건 바로 파일에 (재개 기준)
+
+                    if finished % report_every == 0:
+                        elapsed = time.perf_counter() - start
+                        print(f"[BATCH] {finished}/{len(pending)} 완료 ({finished / elapsed * 60:.1f} topics/min)")
+                submit_next()
+
+    elapsed = time.perf_counter() - start
+    rate = finished / elapsed * 60 if elapsed else 0.0
+    print(f"[DONE] 성공 {finished} / 실패 {failed} / {elapsed:.1f}s / {rate:.1f} topics/min")
+    return finished, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the joke prompt chain over many topics")
+    parser.add_argument("input", help="topics.jsonl 또는 topics.csv")
+    parser.add_argument("output", help="결과 JSONL (이미 있으면 이어서 실행)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--report-every", type=int, default=100)
+    args = parser.parse_args()
+    run_batch(args.input, args.output, args.concurrency, args.report_every)
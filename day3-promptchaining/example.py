@@ -75,22 +75,23 @@ workflow.add_edge("polish_joke", END)
 # Compile
 chain = workflow.compile()
 
-# Show workflow
-print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
-print(chain.get_graph(xray=True).draw_mermaid())
-
-# Invoke
-state = chain.invoke({"topic": "강아지"})
-print("Initial joke:")
-print(state["joke"])
-print("\n--- --- ---\n")
-if "improved_joke" in state:
-    print("Improved joke:")
-    print(state["improved_joke"])
+if __name__ == "__main__":
+    # Show workflow
+    print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
+    print(chain.get_graph(xray=True).draw_mermaid())
+
+    # Invoke
+    state = chain.invoke({"topic": "강아지"})
+    print("Initial joke:")
+    print(state["joke"])
     print("\n--- --- ---\n")
-
-    print("Final joke:")
-    print(state["final_joke"])
-else:
-    print("Final joke:")
-    print(state["joke"])
\ No newline at end of file
+    if "improved_joke" in state:
+        print("Improved joke:")
+        print(state["improved_joke"])
+        print("\n--- --- ---\n")
+
+        print("Final joke:")
+        print(state["final_joke"])
+    else:
+        print("Final joke:")
+        print(state["joke"])
\ No newline at end of file
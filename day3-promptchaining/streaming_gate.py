@@ -0,0 +1,106 @@
+#-------------------------------------
+# Streaming gate: 농담이 다 만들어지기 전에 check_punchline 결과를 먼저 알려준다
+#-------------------------------------
+"""
+example.py 에서는 generate_joke가 끝난 뒤에 check_punchline이 "?" / "!"를 찾는다.
+게이트는 "?"나 "!"가 한 번이라도 나오면 Pass로 확정되므로,
+토큰을 스트리밍하면서 조각마다 검사하면 첫 "?"/"!"가 나온 순간 라우팅 결정을 알 수 있다.
+
+- Pass : 첫 "?"/"!" 토큰 시점에 확정 (생성이 끝날 때까지 기다리지 않음)
+- Fail : 끝까지 안 나와야 확정되므로 생성 완료 시점
+
+확정되는 즉시 custom 스트림으로 {"gate": ..., "time_to_route": ...}를 내보내고,
+조건부 엣지는 state["gate"]에 저장된 값을 그대로 사용한다.
+"""
+
+import time
+
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph, START, END
+
+from example import llm, State, improve_joke, polish_joke
+
+
+class PunchlineGate:
+    """Incremental ``check_punchline``: feed text chunks, get the decision once it is settled"""
+
+    def __init__(self, markers: tuple[str, ...] = ("?", "!")):
+        self.markers = markers
+        self.decision = None
+
+    def feed(self, chunk: str) -> str | None:
+        """Returns "Pass" on the chunk that settles the gate, None otherwise"""
+        if self.decision is None and any(m in chunk for m in self.markers):
+            self.decision = "Pass"
+            return self.decision
+        return None
+
+    def close(self) -> str | None:
+        """End of text: an unsettled gate becomes "Fail" """
+        if self.decision is None:
+            self.decision = "Fail"
+            return self.decision
+        return None
+
+
+# 상태 정의 (게이트 결과 추가)
+class StreamingState(State):
+    gate: str
+
+
+# 노드 1: generate_joke (스트리밍 + 게이트 동시 평가)
+def generate_joke(state: StreamingState):
+    """First LLM call to generate initial joke, evaluating the gate on every token"""
+
+    writer = get_stream_writer()
+    gate = PunchlineGate()
+    start = time.perf_counter()
+    joke = ""
+
+    for chunk in llm.stream(f"{state['topic']}에 대해 짧은 농담을 만들어줘"):
+        joke += chunk.content
+        if gate.feed(chunk.content):
+            writer({"gate": gate.decision, "time_to_route": time.perf_counter() - start})
+
+    if gate.close():
+        writer({"gate": gate.decision, "time_to_route": time.perf_counter() - start})
+
+    return {"joke": joke, "gate": gate.decision}
+
+
+# 게이트 함수: 스트리밍 중에 이미 확정된 결과를 그대로 사용
+def check_punchline(state: StreamingState):
+    """Gate function reading the decision settled while streaming"""
+    return state["gate"]
+
+
+# Build workflow
+workflow = StateGraph(StreamingState)
+
+workflow.add_node("generate_joke", generate_joke)
+workflow.add_node("improve_joke", improve_joke)
+workflow.add_node("polish_joke", polish_joke)
+
+workflow.add_edge(START, "generate_joke")
+workflow.add_conditional_edges(
+    "generate_joke", check_punchline, {"Fail": "improve_joke", "Pass": END}
+)
+workflow.add_edge("improve_joke", "polish_joke")
+workflow.add_edge("polish_joke", END)
+
+streaming_chain = workflow.compile()
+
+
+if __name__ == "__main__":
+    # custom: 게이트 확정 이벤트 / updates: 노드 완료 이벤트
+    start = time.perf_counter()
+    for mode, chunk in streaming_chain.stream({"topic": "강아지"}, stream_mode=["custom", "updates"]):
+        if mode == "custom":
+            print(f"[GATE] {chunk['gate']} (time-to-route {chunk['time_to_route']:.2f}s)")
+        elif "generate_joke" in chunk:
+            print(f"[GENERATE] 완료 ({time.perf_counter() - start:.2f}s)")
+            print(chunk["generate_joke"]["joke"])
+        else:
+            node, update = next(iter(chunk.items()))
+            print(f"\n[{node}] ({time.perf_counter() - start:.2f}s)")
+            print(next(iter(update.values())))
@@ -0,0 +1,213 @@
+#-------------------------------------
+# Async 병렬화: ainvoke 노드 + provider별 rate limit
+#-------------------------------------
+"""
+example.py 의 call_llm_1/2/3 은 sync llm.invoke 노드라서
+병렬 실행이 LangGraph 스레드 풀 크기에 묶여 있다.
+
+여기서는 같은 그래프를 async 노드(ainvoke)로 만들고,
+모든 LLM 호출이 provider별 limiter 하나를 같이 쓰게 한다.
+- token bucket : 초당 요청 수 (InMemoryRateLimiter)
+- semaphore    : 동시에 열린 요청 수
+→ parallel_workflow를 수백 개 동시에 돌려도 quota를 꽉 채우되 넘지는 않음
+
+python async_parallel.py --runs 20            # 실제 모델로 비교
+python async_parallel.py --runs 200 --fake    # 가짜 모델(고정 지연)로 비교
+
+sequential / threaded 는 limiter를 거치지 않으므로, 시간 비교용 async 실행도
+rate limit 없이 동시에 도는 그래프 수만 --threads 로 맞춘다.
+provider limiter를 건 async 시간은 별도 줄(async+limiter)로 출력.
+"""
+
+import asyncio
+import weakref
+
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langgraph.graph import StateGraph, START, END
+
+from example import llm, State, aggregator
+
+
+class ProviderLimiter:
+    """Token bucket + concurrency cap shared by every call to one provider
+
+    async with get_limiter("anthropic"):
+        msg = await llm.ainvoke(...)
+    """
+
+    def __init__(self, requests_per_second: float, max_burst: int, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = InMemoryRateLimiter(
+            requests_per_second=requests_per_second,
+            check_every_n_seconds=0.05,
+            max_bucket_size=max_burst,
+        )
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프마다 하나씩 (루프가 사라지면 같이 정리)
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def __aenter__(self):
+        # 자리(semaphore)를 먼저 잡고 토큰을 꺼내야, 기다리는 동안 토큰이 낭비되지 않음
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        try:
+            await self.rate_limiter.aacquire()
+        except BaseException:
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore().release()
+
+
+# provider별 quota (사용하는 요금제에 맞게 조정)
+PROVIDER_LIMITS = {
+    "anthropic": ProviderLimiter(requests_per_second=8, max_burst=8, max_concurrency=16),
+}
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    return PROVIDER_LIMITS[provider]
+
+
+# Nodes (example.py와 같은 프롬프트, ainvoke + limiter)
+async def call_llm_1(state: State):
+    """First LLM call to generate initial joke"""
+
+    async with get_limiter("anthropic"):
+        msg = await llm.ainvoke(f"{state['topic']}에 대한 농담을 만들어줘")
+    return {"joke": msg.content}
+
+
+async def call_llm_2(state: State):
+    """Second LLM call to generate story"""
+
+    async with get_limiter("anthropic"):
+        msg = await llm.ainvoke(f"{state['topic']}에 대한 이야기를 만들어줘")
+    return {"story": msg.content}
+
+
+async def call_llm_3(state: State):
+    """Third LLM call to generate poem"""
+
+    async with get_limiter("anthropic"):
+        msg = await llm.ainvoke(f"{state['topic']}에 대한 시를 만들어줘")
+    return {"poem": msg.content}
+
+
+# Build workflow (구조는 example.py와 동일)
+async_parallel_builder = StateGraph(State)
+
+async_parallel_builder.add_node("call_llm_1", call_llm_1)
+async_parallel_builder.add_node("call_llm_2", call_llm_2)
+async_parallel_builder.add_node("call_llm_3", call_llm_3)
+async_parallel_builder.add_node("aggregator", aggregator)
+
+async_parallel_builder.add_edge(START, "call_llm_1")
+async_parallel_builder.add_edge(START, "call_llm_2")
+async_parallel_builder.add_edge(START, "call_llm_3")
+async_parallel_builder.add_edge("call_llm_1", "aggregator")
+async_parallel_builder.add_edge("call_llm_2", "aggregator")
+async_parallel_builder.add_edge("call_llm_3", "aggregator")
+async_parallel_builder.add_edge("aggregator", END)
+async_parallel_workflow = async_parallel_builder.compile()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    import example
+    from example import parallel_workflow
+
+    parser = argparse.ArgumentParser(description="Sequential vs threaded vs async parallel_workflow")
+    parser.add_argument("--runs", type=int, default=20)  # 동시에 돌릴 parallel_workflow 수
+    parser.add_argument("--threads", type=int, default=16)  # 동시에 도는 그래프 수 (threaded의 max_concurrency, async 비교 실행)
+    parser.add_argument("--fake", action="store_true", help="고정 지연 가짜 모델 사용 (API 호출 없음)")
+    parser.add_argument("--latency", type=float, default=0.5)  # 가짜 모델 응답 지연(초)
+    parser.add_argument("--rps", type=float, help="anthropic limiter 초당 요청 수 덮어쓰기")
+    parser.add_argument("--max-concurrency", type=int, help="anthropic limiter 동시 요청 수 덮어쓰기")
+    args = parser.parse_args()
+
+    if args.rps or args.max_concurrency:
+        default = get_limiter("anthropic")
+        rps = args.rps or default.rate_limiter.requests_per_second
+        PROVIDER_LIMITS["anthropic"] = ProviderLimiter(
+            requests_per_second=rps,
+            max_burst=max(1, int(rps)),
+            max_concurrency=args.max_concurrency or default.max_concurrency,
+        )
+
+    if args.fake:
+        from langchain_core.language_models import BaseChatModel
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, ChatResult
+
+        class FakeLatencyChatModel(BaseChatModel):
+            latency: float
+
+            @property
+            def _llm_type(self) -> str:
+                return "fake-latency"
+
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                time.sleep(self.latency)
+                return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+            async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+                await asyncio.sleep(self.latency)
+                return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+        # 두 그래프의 노드가 모두 가짜 모델을 보도록 교체
+        llm = example.llm = FakeLatencyChatModel(latency=args.latency)
+
+    topics = [f"고양이 {i}" for i in range(args.runs)]
+
+    # 1) sequential: 주제도, 주제 안의 3개 호출도 하나씩
+    start = time.perf_counter()
+    for topic in topics:
+        state = {"topic": topic}
+        for node in (example.call_llm_1, example.call_llm_2, example.call_llm_3, aggregator):
+            state.update(node(state))
+    sequential = time.perf_counter() - start
+
+    # 2) threaded: 기존 sync 그래프를 스레드 풀로 batch 실행
+    start = time.perf_counter()
+    parallel_workflow.batch([{"topic": t} for t in topics], config={"max_concurrency": args.threads})
+    threaded = time.perf_counter() - start
+
+    # 3) async: ainvoke 노드
+    async def run_async(max_graphs: int):
+        gate = asyncio.Semaphore(max_graphs)
+
+        async def run_one(topic):
+            async with gate:
+                await async_parallel_workflow.ainvoke({"topic": topic})
+
+        await asyncio.gather(*(run_one(t) for t in topics))
+
+    def timed_async(limiter: ProviderLimiter, max_graphs: int) -> float:
+        PROVIDER_LIMITS["anthropic"] = limiter
+        start = time.perf_counter()
+        asyncio.run(run_async(max_graphs))
+        return time.perf_counter() - start
+
+    limiter = get_limiter("anthropic")
+    # threaded와 같은 조건: rate limit 없이 동시에 도는 그래프 수만 --threads 로 제한
+    unthrottled = ProviderLimiter(requests_per_second=1e9, max_burst=10**9, max_concurrency=args.runs * 3)
+    async_time = timed_async(unthrottled, args.threads)
+    # 4) async + provider limiter: quota를 지키는 실제 운영 설정 (그래프 수 제한 없음)
+    limited_time = timed_async(limiter, args.runs)
+
+    print(f"runs={args.runs} (LLM 호출 {args.runs * 3}회)")
+    print(f"sequential    : {sequential:8.2f}s")
+    print(f"threaded      : {threaded:8.2f}s (max_concurrency={args.threads})")
+    print(f"async         : {async_time:8.2f}s (동시 그래프 {args.threads}개, rate limit 없음)")
+    print(f"async+limiter : {limited_time:8.2f}s ({limiter.rate_limiter.requests_per_second}req/s, "
+          f"동시 {limiter.max_concurrency}개 → 최소 {args.runs * 3 / limiter.rate_limiter.requests_per_second:.2f}s)")
@@ -76,10 +76,11 @@ parallel_builder.add_edge("call_llm_3", "aggregator")
 parallel_builder.add_edge("aggregator", END)
 parallel_workflow = parallel_builder.compile()
 
-# Show workflow
-print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
-print(parallel_workflow.get_graph(xray=True).draw_mermaid())
-
-# Invoke
-state = parallel_workflow.invoke({"topic": "고양이"})
-print(state["combined_output"])
\ No newline at end of file
+if __name__ == "__main__":
+    # Show workflow
+    print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
+    print(parallel_workflow.get_graph(xray=True).draw_mermaid())
+
+    # Invoke
+    state = parallel_workflow.invoke({"topic": "고양이"})
+    print(state["combined_output"])
\ No newline at end of file
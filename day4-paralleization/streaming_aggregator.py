@@ -0,0 +1,96 @@
+#-------------------------------------
+# Streaming aggregator: 브랜치가 하나 끝날 때마다 합친 결과를 먼저 보여준다
+#-------------------------------------
+"""
+example.py 의 aggregator는 joke / story / poem 이 모두 끝나야 combined_output을 만든다.
+→ 사용자는 가장 느린 브랜치가 끝날 때까지 아무것도 못 봄
+
+여기서는 각 브랜치가 끝나는 즉시, 지금까지 끝난 부분으로 만든 combined 문서를
+custom 스트림(stream writer)으로 내보낸다. 아직 안 끝난 부분은 "(작성 중...)"으로 표시.
+마지막 aggregator는 example.py 것을 그대로 쓰므로 최종 combined_output은 동일하다.
+
+브랜치들은 같은 super-step에서 병렬로 돌기 때문에 서로의 state 업데이트를 볼 수 없다.
+그래서 실행마다 PartialOutput(런타임 context)을 하나 넘겨 완료된 부분을 모은다.
+"""
+
+import threading
+from dataclasses import dataclass, field
+
+from langgraph.graph import StateGraph, START, END
+from langgraph.runtime import Runtime
+
+from example import State, call_llm_1, call_llm_2, call_llm_3, aggregator
+
+PENDING = "(작성 중...)"
+
+
+def render_combined(topic: str, parts: dict[str, str]) -> str:
+    """Same layout as ``aggregator``; missing parts are shown as pending"""
+
+    combined = f"{topic}에 대한 이야기, 농담, 시를 만들어줘!\n\n"
+    combined += f"STORY:\n{parts.get('story', PENDING)}\n\n"
+    combined += f"JOKE:\n{parts.get('joke', PENDING)}\n\n"
+    combined += f"POEM:\n{parts.get('poem', PENDING)}"
+    return combined
+
+
+@dataclass
+class PartialOutput:
+    """Per-run collector for branch results (pass as ``context=PartialOutput()``)"""
+
+    parts: dict[str, str] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, topic: str, key: str, value: str) -> tuple[str, list[str]]:
+        with self.lock:  # sync 노드는 스레드에서 동시에 실행됨
+            self.parts[key] = value
+            return render_combined(topic, self.parts), sorted(self.parts)
+
+
+def streaming_branch(node, key: str):
+    """Wrap a branch node so it emits the partial combined document when it finishes"""
+
+    def branch(state: State, runtime: Runtime[PartialOutput]):
+        update = node(state)
+        if runtime.context is not None:  # context 없이 실행하면 일반 병렬 그래프와 동일
+            combined, done = runtime.context.add(state["topic"], key, update[key])
+            runtime.stream_writer({"combined_output": combined, "done": done})
+        return update
+
+    branch.__name__ = node.__name__
+    return branch
+
+
+# Build workflow (구조는 example.py와 동일, 브랜치만 감쌈)
+streaming_builder = StateGraph(State, context_schema=PartialOutput)
+
+streaming_builder.add_node("call_llm_1", streaming_branch(call_llm_1, "joke"))
+streaming_builder.add_node("call_llm_2", streaming_branch(call_llm_2, "story"))
+streaming_builder.add_node("call_llm_3", streaming_branch(call_llm_3, "poem"))
+streaming_builder.add_node("aggregator", aggregator)
+
+streaming_builder.add_edge(START, "call_llm_1")
+streaming_builder.add_edge(START, "call_llm_2")
+streaming_builder.add_edge(START, "call_llm_3")
+streaming_builder.add_edge("call_llm_1", "aggregator")
+streaming_builder.add_edge("call_llm_2", "aggregator")
+streaming_builder.add_edge("call_llm_3", "aggregator")
+streaming_builder.add_edge("aggregator", END)
+streaming_workflow = streaming_builder.compile()
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    for mode, chunk in streaming_workflow.stream(
+        {"topic": "고양이"},
+        context=PartialOutput(),  # 실행마다 새로 만들기
+        stream_mode=["custom", "values"],
+    ):
+        if mode == "custom":
+            print(f"\n===== 부분 결과 {chunk['done']} ({time.perf_counter() - start:.2f}s) =====")
+            print(chunk["combined_output"])
+        elif "combined_output" in chunk:
+            print(f"\n===== 최종 결과 ({time.perf_counter() - start:.2f}s) =====")
+            print(chunk["combined_output"])
@@ -1,6 +1,7 @@
 # 기본 설정
 import os
 import sys
+import threading
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from typing_extensions import TypedDict, Optional
@@ -181,15 +182,33 @@ def create_workflow(nodes, aggregator_func):
     return builder.compile()
 
 # ----------------------------------------------------------------------
-# Graph Export (LangGraph Server용)
+# Lazy Graph Registry (처음 쓰는 도메인만 컴파일)
 # ----------------------------------------------------------------------
-graph_travel = create_workflow([node_travel_1, node_travel_2, node_travel_3], agg_travel)
-graph_sns = create_workflow([node_sns_1, node_sns_2, node_sns_3], agg_sns)
-graph_debate = create_workflow([node_debate_1, node_debate_2, node_debate_3], agg_debate)
-graph_study = create_workflow([node_study_1, node_study_2, node_study_3], agg_study)
-graph_diet = create_workflow([node_diet_1, node_diet_2, node_diet_3], agg_diet)
-graph_gift = create_workflow([node_gift_1, node_gift_2, node_gift_3], agg_gift)
-graph_news = create_workflow([node_news_1, node_news_2, node_news_3], agg_news)
+# 도메인 이름 → (병렬 노드 3개, 취합 노드)
+# 모든 노드는 위에서 만든 llm 하나를 같이 사용
+DOMAINS = {
+    "travel": ([node_travel_1, node_travel_2, node_travel_3], agg_travel),
+    "sns": ([node_sns_1, node_sns_2, node_sns_3], agg_sns),
+    "debate": ([node_debate_1, node_debate_2, node_debate_3], agg_debate),
+    "study": ([node_study_1, node_study_2, node_study_3], agg_study),
+    "diet": ([node_diet_1, node_diet_2, node_diet_3], agg_diet),
+    "gift": ([node_gift_1, node_gift_2, node_gift_3], agg_gift),
+    "news": ([node_news_1, node_news_2, node_news_3], agg_news),
+}
+
+_compiled_graphs = {}
+_compile_lock = threading.Lock()
+
+def get_graph(domain: str):
+    """도메인 그래프를 처음 요청될 때 컴파일하고, 이후에는 캐시된 그래프를 반환"""
+    graph = _compiled_graphs.get(domain)
+    if graph is None:
+        with _compile_lock:  # 여러 요청이 동시에 들어와도 한 번만 컴파일
+            graph = _compiled_graphs.get(domain)
+            if graph is None:
+                nodes, aggregator_func = DOMAINS[domain]
+                graph = _compiled_graphs[domain] = create_workflow(nodes, aggregator_func)
+    return graph
 
 # ----------------------------------------------------------------------
 # Master Router Graph (전체 통합 그래프)
@@ -199,7 +218,7 @@ class MasterState(TypedDict):
     category: str      # 라우팅 카테고리
     final_output: str
 
-def router_node(state: UniversalState):
+def router_node(state: MasterState):
     """주제를 분석하여 어떤 작업을 수행할지 결정하는 라우터"""
     prompt = f"""
     사용자의 입력 주제: '{state['topic']}'
@@ -220,7 +239,7 @@ def router_node(state: UniversalState):
     category = msg.content.strip()
     return {"category": category}
 
-def route_decision(state: UniversalState):
+def route_decision(state: MasterState):
     """category 값에 따라 다음 노드 결정"""
     cat = state.get("category", "")
     if "1" in cat: return "go_travel"
@@ -232,59 +251,66 @@ def route_decision(state: UniversalState):
     if "7" in cat: return "go_news"
     return END
 
-# Master Graph 빌드
-master_builder = StateGraph(UniversalState)
-master_builder.add_node("router", router_node)
-
-# 각 서브 그래프를 노드로 추가 (Hierarchical Graph)
-master_builder.add_node("run_travel", graph_travel)
-master_builder.add_node("run_sns", graph_sns)
-master_builder.add_node("run_debate", graph_debate)
-master_builder.add_node("run_study", graph_study)
-master_builder.add_node("run_diet", graph_diet)
-master_builder.add_node("run_gift", graph_gift)
-master_builder.add_node("run_news", graph_news)
-
-master_builder.add_edge(START, "router")
-
-# 조건부 엣지 설정
-master_builder.add_conditional_edges(
-    "router",
-    route_decision,
-    {
-        "go_travel": "run_travel",
-        "go_sns": "run_sns",
-        "go_debate": "run_debate",
-        "go_study": "run_study",
-        "go_diet": "run_diet",
-        "go_gift": "run_gift",
-        "go_news": "run_news"
-    }
-)
-
-# 각 서브 그래프 실행 후 종료
-master_builder.add_edge("run_travel", END)
-master_builder.add_edge("run_sns", END)
-master_builder.add_edge("run_debate", END)
-master_builder.add_edge("run_study", END)
-master_builder.add_edge("run_diet", END)
-master_builder.add_edge("run_gift", END)
-master_builder.add_edge("run_news", END)
+def run_domain(domain: str):
+    """서브 그래프를 감싼 노드: 라우터가 고른 도메인만 그 자리에서 컴파일/실행"""
+    def node(state: MasterState):
+        result = get_graph(domain).invoke({"topic": state["topic"]})
+        return {"final_output": result["final_output"]}
+    node.__name__ = f"run_{domain}"
+    return node
+
+def create_master_graph():
+    # category가 state에 남도록 MasterState 사용
+    master_builder = StateGraph(MasterState)
+    master_builder.add_node("router", router_node)
+
+    # 각 도메인을 노드로 추가 (컴파일된 서브 그래프 대신 get_graph를 부르는 노드)
+    for domain in DOMAINS:
+        master_builder.add_node(f"run_{domain}", run_domain(domain))
+        master_builder.add_edge(f"run_{domain}", END)
+
+    master_builder.add_edge(START, "router")
+
+    # 조건부 엣지 설정
+    master_builder.add_conditional_edges(
+        "router",
+        route_decision,
+        {**{f"go_{domain}": f"run_{domain}" for domain in DOMAINS}, END: END},
+    )
+    return master_builder.compile()
+
+def get_master_graph():
+    graph = _compiled_graphs.get("master")
+    if graph is None:
+        with _compile_lock:
+            graph = _compiled_graphs.get("master")
+            if graph is None:
+                graph = _compiled_graphs["master"] = create_master_graph()
+    return graph
 
-graph_master = master_builder.compile()
+# ----------------------------------------------------------------------
+# Graph Export (LangGraph Server용)
+# ----------------------------------------------------------------------
+# graph_travel, graph_master 등 기존 이름으로 접근하면 그때 컴파일 (PEP 562)
+def __getattr__(name: str):
+    if name == "graph_master":
+        return get_master_graph()
+    if name.startswith("graph_") and name[len("graph_"):] in DOMAINS:
+        return get_graph(name[len("graph_"):])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ----------------------------------------------------------------------
 # Main Execution (CLI Menu)
 # ----------------------------------------------------------------------
 def main():
     programs = {
-        "1": ("여행 계획 어시스턴트", graph_travel),
-        "2": ("SNS 마케팅 패키지", graph_sns),
-        "3": ("토론/논쟁 판결기", graph_debate),
-        "4": ("학습 튜터", graph_study),
-        "5": ("건강 식단 컨설턴트", graph_diet),
-        "6": ("선물 추천 코디네이터", graph_gift),
-        "7": ("뉴스 인사이트 분석", graph_news),
+        "1": ("여행 계획 어시스턴트", "travel"),
+        "2": ("SNS 마케팅 패키지", "sns"),
+        "3": ("토론/논쟁 판결기", "debate"),
+        "4": ("학습 튜터", "study"),
+        "5": ("건강 식단 컨설턴트", "diet"),
+        "6": ("선물 추천 코디네이터", "gift"),
+        "7": ("뉴스 인사이트 분석", "news"),
     }
 
     print("\n" + "="*50)
@@ -300,7 +326,8 @@ def main():
         print("잘못된 번호입니다.")
         sys.exit()
 
-    name, workflow = programs[choice]
+    name, domain = programs[choice]
+    workflow = get_graph(domain)  # 선택한 도메인만 컴파일
     topic = input(f"\n[{name}] 주제를 입력하세요: ")
 
     print(f"\n'{name}' 실행 중... (병렬 처리 시작)\n")
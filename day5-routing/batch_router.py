@@ -0,0 +1,184 @@
+#-------------------------------------
+# Batch routing: 입력 K개를 구조화 출력 호출 한 번으로 분류
+#-------------------------------------
+"""
+example.py 의 llm_call_router는 입력 하나당 구조화 출력 호출 1번.
+오프라인으로 수천 개를 처리할 때는 K개씩 묶어서 한 번에 분류한다.
+→ 라우팅 비용이 입력당 약 1/K 로 줄어듦
+
+- 각 입력에 번호를 붙여 보내고, 결과는 번호로 다시 맞춘다
+- 파싱 실패 / 빠진 번호가 있으면 "실패한 것만" 다시 요청
+  (전체가 실패하면 절반으로 나눠서 재시도, 마지막 1개는 기존 llm_call_router 사용)
+- 마지막 1개도 ROUTE_NODES에 없는 결정(None 등)을 내면 실패로 보고 SINGLE_ATTEMPTS 번까지 재시도,
+  그래도 안 되면 RuntimeError
+- route_batch는 (결정 목록, 이번 호출에서 쓴 라우팅 호출 수)를 돌려줌
+- 분류가 끝나면 Send로 각 입력을 llm_call_1/2/3 에 나눠 보냄
+"""
+
+import operator
+from typing import Annotated
+
+from typing_extensions import TypedDict, Literal
+from langchain.messages import HumanMessage, SystemMessage
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
+from pydantic import BaseModel, Field
+
+from example import llm, llm_call_1, llm_call_2, llm_call_3, llm_call_router
+
+
+# 입력 하나에 대한 결정
+class RouteItem(BaseModel):
+    index: int = Field(description="입력 번호")
+    step: Literal["poem", "story", "joke"] = Field(
+        description="해당 입력에 대해 poem/story/joke 중 하나를 선택하여라"
+    )
+
+
+# 여러 입력에 대한 결정 목록
+class BatchRoute(BaseModel):
+    decisions: list[RouteItem] = Field(description="입력 번호별 라우팅 결정 목록")
+
+
+batch_router = llm.with_structured_output(BatchRoute)
+
+ROUTE_NODES = {"story": llm_call_1, "joke": llm_call_2, "poem": llm_call_3}
+SINGLE_ATTEMPTS = 2  # 입력 1개를 llm_call_router로 분류할 때 최대 시도 횟수
+
+
+def _route_one(index: int, text: str) -> tuple[dict[int, str], int]:
+    """Route a single input with the original router, retrying invalid decisions"""
+    for attempt in range(1, SINGLE_ATTEMPTS + 1):
+        try:
+            decision = llm_call_router({"input": text})["decision"]
+        except Exception as e:  # 구조화 출력 파싱 실패 (None 결과 포함)
+            decision = None
+            print(f"[BATCH ROUTER] {index}번 라우팅 실패: {e!r}")
+        if decision in ROUTE_NODES:
+            return {index: decision}, attempt
+        print(f"[BATCH ROUTER] {index}번 결정이 올바르지 않음: {decision!r}")
+    raise RuntimeError(f"{SINGLE_ATTEMPTS}번 시도해도 {index}번 입력을 라우팅하지 못함: {text!r}")
+
+
+def _route_chunk(items: list[tuple[int, str]]) -> tuple[dict[int, str], int]:
+    """Route ``(index, input)`` pairs with one call; retry only what failed. Returns (decisions, calls)"""
+
+    if len(items) == 1:
+        return _route_one(*items[0])
+
+    numbered = "\n".join(f"{i}. {text}" for i, (_, text) in enumerate(items))
+    decided = {}
+    calls = 1
+    try:
+        result = batch_router.invoke(
+            [
+                SystemMessage(
+                    content="각 유저 입력에 대해 poem/story/joke 중 하나를 선택하여라. "
+                    "모든 입력 번호에 대해 정확히 하나씩 결정을 반환하여라."
+                ),
+                HumanMessage(content=numbered),
+            ]
+        )
+        for d in result.decisions:
+            if 0 <= d.index < len(items) and d.index not in decided and d.step in ROUTE_NODES:
+                decided[d.index] = d.step
+    except Exception as e:  # 구조화 출력 파싱 실패
+        print(f"[BATCH ROUTER] {len(items)}개 파싱 실패: {e!r}")
+
+    routed = {items[i][0]: step for i, step in decided.items()}
+    missing = [item for i, item in enumerate(items) if i not in decided]
+    if len(missing) == len(items):
+        half = len(items) // 2  # 전부 실패 → 반으로 나눠서
+        retries = [items[:half], items[half:]]
+    else:
+        retries = [missing] if missing else []  # 빠진 것만 다시
+
+    for chunk in retries:
+        chunk_routed, chunk_calls = _route_chunk(chunk)
+        routed.update(chunk_routed)
+        calls += chunk_calls
+    return routed, calls
+
+
+def route_batch(inputs: list[str], batch_size: int = 20) -> tuple[list[str], int]:
+    """One decision per input, in input order, and the number of routing calls used"""
+    items = list(enumerate(inputs))
+    routed, calls = {}, 0
+    for start in range(0, len(items), batch_size):
+        chunk_routed, chunk_calls = _route_chunk(items[start:start + batch_size])
+        routed.update(chunk_routed)
+        calls += chunk_calls
+    return [routed[i] for i in range(len(inputs))], calls
+
+
+# State
+class BatchState(TypedDict):
+    inputs: list[str]  # 사용자 입력 목록
+    decisions: list[str]  # 입력별 분기 결정
+    routing_calls: int  # 라우팅에 쓴 LLM 호출 수
+    results: Annotated[list, operator.add]  # 워커 결과가 쌓이는 곳
+    outputs: list[str]  # 입력 순서대로 정렬된 출력
+
+
+class ItemState(TypedDict):
+    index: int
+    input: str
+    decision: str
+
+
+# Nodes
+def batch_router_node(state: BatchState):
+    """Route every input with batched structured-output calls"""
+    if not state["inputs"]:
+        return {"decisions": [], "routing_calls": 0, "outputs": []}  # 입력이 없으면 워커/collect 없이 끝남
+    decisions, calls = route_batch(state["inputs"])
+    print(f"[BATCH ROUTER] {len(decisions)}개 입력 / 라우팅 호출 {calls}회")
+    return {"decisions": decisions, "routing_calls": calls}
+
+
+def run_item(state: ItemState):
+    """Run the node chosen for one input (llm_call_1/2/3)"""
+    result = ROUTE_NODES[state["decision"]]({"input": state["input"]})
+    return {"results": [{"index": state["index"], "output": result["output"]}]}
+
+
+def collect(state: BatchState):
+    """Put outputs back in input order"""
+    ordered = sorted(state["results"], key=lambda r: r["index"])
+    return {"outputs": [r["output"] for r in ordered]}
+
+
+def assign_items(state: BatchState):
+    return [
+        Send("run_item", {"index": i, "input": text, "decision": decision})
+        for i, (text, decision) in enumerate(zip(state["inputs"], state["decisions"]))
+    ]
+
+
+# Build workflow
+batch_builder = StateGraph(BatchState)
+
+batch_builder.add_node("batch_router", batch_router_node)
+batch_builder.add_node("run_item", run_item)
+batch_builder.add_node("collect", collect)
+
+batch_builder.add_edge(START, "batch_router")
+batch_builder.add_conditional_edges("batch_router", assign_items, ["run_item"])
+batch_builder.add_edge("run_item", "collect")
+batch_builder.add_edge("collect", END)
+
+batch_router_workflow = batch_builder.compile()
+
+
+if __name__ == "__main__":
+    inputs = [
+        "고양이에 대해 짧은 농담을 적어줘.",
+        "바다를 주제로 시를 써줘",
+        "용감한 토끼가 나오는 이야기를 들려줘",
+        "월요일 아침에 대한 유머 한 줄",
+        "가을 낙엽에 대한 짧은 시",
+    ]
+    state = batch_router_workflow.invoke({"inputs": inputs})
+    for text, decision, output in zip(inputs, state["decisions"], state["outputs"]):
+        print(f"\n[{decision}] {text}\n{output[:100]}")
+    print(f"\n라우팅 호출 {state['routing_calls']}회 / 입력 {len(inputs)}개")
@@ -114,10 +114,11 @@ router_builder.add_edge("llm_call_3", END)
 # Compile workflow
 router_workflow = router_builder.compile()
 
-# Show the workflow
-print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
-print(router_workflow.get_graph(xray=True).draw_mermaid())
-
-# Invoke
-answer = router_workflow.invoke({"input": "고양이에 대해 짧은 농담을 적어줘."})
-print(f"\nAnswer: {answer}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Show the workflow
+    print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
+    print(router_workflow.get_graph(xray=True).draw_mermaid())
+
+    # Invoke
+    answer = router_workflow.invoke({"input": "고양이에 대해 짧은 농담을 적어줘."})
+    print(f"\nAnswer: {answer}")
\ No newline at end of file
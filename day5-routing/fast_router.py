@@ -0,0 +1,198 @@
+#-------------------------------------
+# Fast pre-router: 확실한 입력은 로컬에서 바로 분류, 애매할 때만 LLM 라우터 호출
+#-------------------------------------
+"""
+example.py 에서는 모든 입력이 router.invoke(구조화 출력 LLM 호출)를 거친다.
+"고양이에 대해 짧은 농담을 적어줘." 처럼 뻔한 입력도 LLM 왕복 시간을 다 낸다.
+
+1단계: 문자 n-gram 나이브 베이즈 분류기 (마이크로초 단위)
+       - 키워드 몇 개로 시작하고, LLM 라우터가 내린 Route 결정 로그로 계속 학습
+       - 학습한 적 없는 n-gram은 점수에서 빼고, 아는 3-gram이 min_evidence개 미만이면
+         확신도 0 (처음 보는 입력은 무조건 LLM 라우터로)
+2단계: 확신도(confidence)가 threshold보다 낮을 때만 기존 llm_call_router 호출
+       - LLM 결정은 route_log.jsonl 에 남기고 분류기에도 바로 반영
+
+route별 로컬 처리 비율(hit rate)과 아낀 시간(LLM 평균 지연 × 로컬 처리 수)을 출력한다.
+"""
+
+import json
+import math
+import os
+import time
+from collections import Counter, defaultdict
+
+from langgraph.graph import StateGraph, START, END
+
+from example import State, llm_call_1, llm_call_2, llm_call_3, llm_call_router, route_decision
+
+ROUTES = ("poem", "story", "joke")
+
+# 로그가 없을 때 쓰는 시작 키워드 (한 단어 = 한 개의 가짜 학습 샘플)
+SEED_KEYWORDS = {
+    "poem": ["시를", "시 한 편", "시로", "운율", "poem", "poetry", "하이쿠", "동시"],
+    "story": ["이야기", "스토리", "소설", "동화", "줄거리", "story", "tale"],
+    "joke": ["농담", "농담을", "유머", "개그", "웃긴", "아재개그", "joke", "funny"],
+}
+
+
+def char_ngrams(text: str, sizes=(1, 2, 3)) -> list[str]:
+    text = " ".join(text.lower().split())
+    padded = f" {text} "
+    return [padded[i:i + n] for n in sizes for i in range(len(padded) - n + 1)]
+
+
+class NgramRouteClassifier:
+    """Multinomial naive Bayes over character n-grams"""
+
+    def __init__(self, alpha: float = 0.5, min_evidence: int = 2):
+        self.alpha = alpha  # 라플라스 스무딩
+        self.min_evidence = min_evidence  # 확신도를 내려면 필요한, 학습한 적 있는 3-gram 수
+        self.doc_counts = Counter()  # route별 학습 샘플 수
+        self.gram_counts = defaultdict(Counter)  # route별 n-gram 빈도
+        self.totals = Counter()  # route별 전체 n-gram 수
+        self.vocab = set()
+
+    def learn(self, text: str, route: str):
+        grams = char_ngrams(text)
+        self.doc_counts[route] += 1
+        self.gram_counts[route].update(grams)
+        self.totals[route] += len(grams)
+        self.vocab.update(grams)
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Best route and its posterior probability (0 when the text is mostly unseen)"""
+        # 모르는 n-gram은 route마다 분모만 달라서, 처음 보는 입력일수록 샘플이 적은 route로 쏠림 → 제외
+        grams = [g for g in char_ngrams(text) if g in self.vocab]
+        n_docs = sum(self.doc_counts.values())
+        vocab_size = len(self.vocab) + 1
+        scores = {}
+        for route in ROUTES:
+            score = math.log((self.doc_counts[route] + 1) / (n_docs + len(ROUTES)))
+            counts, total = self.gram_counts[route], self.totals[route]
+            denominator = math.log(total + self.alpha * vocab_size)
+            score += sum(math.log(counts[g] + self.alpha) - denominator for g in grams)
+            scores[route] = score
+
+        # log-sum-exp로 확률 정규화
+        best = max(scores, key=scores.get)
+        if sum(len(g) == 3 for g in grams) < self.min_evidence:
+            return best, 0.0  # 근거 부족 → LLM 라우터가 판단
+        norm = sum(math.exp(s - scores[best]) for s in scores.values())
+        return best, 1 / norm
+
+
+class FastPreRouter:
+    """Local classifier in front of the LLM router, with per-route stats"""
+
+    def __init__(self, threshold: float = 0.9, log_path: str = "route_log.jsonl"):
+        self.threshold = threshold
+        self.log_path = log_path
+        self.classifier = NgramRouteClassifier()
+        self.local_hits = Counter()  # route별 로컬 처리 수
+        self.fallbacks = Counter()  # route별 LLM 라우터 호출 수
+        self.local_seconds = 0.0
+        self.llm_seconds = 0.0
+
+        for route, keywords in SEED_KEYWORDS.items():
+            for keyword in keywords:
+                self.classifier.learn(keyword, route)
+
+        # 지난 실행에서 LLM이 내린 결정으로 학습
+        if os.path.exists(log_path):
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    if record.get("step") in ROUTES:  # 예전에 잘못 기록된 줄은 건너뜀
+                        self.classifier.learn(record["input"], record["step"])
+
+    def route(self, state: State) -> dict:
+        start = time.perf_counter()
+        step, confidence = self.classifier.predict(state["input"])
+        self.local_seconds += time.perf_counter() - start
+
+        if confidence >= self.threshold:
+            self.local_hits[step] += 1
+            print(f"Decision: {step} (local, p={confidence:.2f})")
+            return {"decision": step}
+
+        # 애매한 입력 → 기존 LLM 라우터
+        start = time.perf_counter()
+        decision = llm_call_router(state)
+        self.llm_seconds += time.perf_counter() - start
+
+        step = decision["decision"]
+        self.fallbacks[step] += 1
+        # route가 아닌 결정(None 등)은 학습/기록하지 않음
+        if step in ROUTES:
+            self.classifier.learn(state["input"], step)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"input": state["input"], "step": step}, ensure_ascii=False) + "\n")
+        return decision
+
+    def report(self) -> str:
+        total_fallbacks = sum(self.fallbacks.values())
+        avg_llm = self.llm_seconds / total_fallbacks if total_fallbacks else 0.0
+        lines = [f"{'route':<6} {'local':>6} {'llm':>5} {'hit rate':>9} {'saved':>8}"]
+        for route in ROUTES:
+            hits, misses = self.local_hits[route], self.fallbacks[route]
+            rate = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f"{route:<6} {hits:>6} {misses:>5} {rate:>9.0%} {hits * avg_llm:>7.2f}s")
+        total_hits = sum(self.local_hits.values())
+        calls = total_hits + total_fallbacks
+        avg_local = self.local_seconds / calls * 1e6 if calls else 0.0
+        lines.append(f"로컬 분류 평균 {avg_local:.0f}µs / LLM 라우터 평균 {avg_llm * 1000:.0f}ms")
+        return "\n".join(lines)
+
+
+pre_router = FastPreRouter(threshold=0.9)
+
+
+# 라우터 노드 (로컬 → LLM 순서)
+def fast_llm_call_router(state: State):
+    """Route locally when confident, otherwise ask the LLM router"""
+    return pre_router.route(state)
+
+
+# Build workflow (example.py와 동일, 라우터 노드만 교체)
+router_builder = StateGraph(State)
+
+router_builder.add_node("llm_call_1", llm_call_1)
+router_builder.add_node("llm_call_2", llm_call_2)
+router_builder.add_node("llm_call_3", llm_call_3)
+router_builder.add_node("llm_call_router", fast_llm_call_router)
+
+router_builder.add_edge(START, "llm_call_router")
+router_builder.add_conditional_edges(
+    "llm_call_router",
+    route_decision,
+    {
+        "llm_call_1": "llm_call_1",
+        "llm_call_2": "llm_call_2",
+        "llm_call_3": "llm_call_3",
+    },
+)
+router_builder.add_edge("llm_call_1", END)
+router_builder.add_edge("llm_call_2", END)
+router_builder.add_edge("llm_call_3", END)
+
+fast_router_workflow = router_builder.compile()
+
+
+if __name__ == "__main__":
+    # 학습한 적 없는 입력은 확신도가 낮아서 LLM 라우터로 가야 함
+    for text in ["asdkjfh qwpoeiru zmxncv lkjhgf", "오늘 회의록을 세 줄로 요약해서 팀장님께 보낼 이메일로 정리해줘"]:
+        step, confidence = pre_router.classifier.predict(text)
+        assert confidence < pre_router.threshold, f"처음 보는 입력이 로컬에서 분류됨: {text} → {step} ({confidence:.3f})"
+
+    inputs = [
+        "고양이에 대해 짧은 농담을 적어줘.",
+        "바다를 주제로 시를 써줘",
+        "용감한 토끼가 나오는 동화 같은 이야기를 들려줘",
+        "비 오는 날에 어울리는 글 하나 부탁해",  # 애매한 입력 → LLM 라우터
+        "강아지 아재개그 하나만",
+    ]
+    for text in inputs:
+        answer = fast_router_workflow.invoke({"input": text})
+        print(f"  {text} → {answer['decision']}\n")
+
+    print(pre_router.report())
@@ -0,0 +1,162 @@
+#-------------------------------------
+# Routing cache: 정규화한 입력 → 라우팅 결정 캐시
+#-------------------------------------
+"""
+같은(또는 거의 같은) 입력을 다시 분류할 때 LLM 라우터를 부르지 않는다.
+
+정규화 : 유니코드 NFKC (호환 자모 ㄱㅏ → 가, 전각 문자 → 반각), 대소문자 무시,
+         공백 하나로 합치기, 끝의 문장부호(. ! ? ~) 제거
+저장   : 메모리 LRU + (선택) SQLite 파일 → 다시 실행해도 결정 유지
+연결   : 라우터 노드/라우팅 함수에 데코레이터로 붙이기만 하면 됨
+
+    cache = RouteCache(max_entries=10_000, sqlite_path="route_cache.sqlite")
+
+    # example.py — {"decision": "poem"} 을 반환하는 라우터 노드
+    llm_call_router = cached_route(cache, "input")(llm_call_router)
+
+    # submissions/bjy.py — 감정 분류기
+    emotion_classifier = cached_route(cache, "user_input")(emotion_classifier)
+
+    # submissions/yjy.py — 과목 라우터 (질문 + 답안 둘 다 키에 포함)
+    route_subject = cached_route(cache, "question", "student_answer")(route_subject)
+
+    cache.stats  # {"hits": 3, "misses": 1, "hit_rate": 0.75, "size": 1}
+"""
+
+import functools
+import json
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+
+
+# day6-orchestrator/plan_cache.py 의 normalize_topic 과 같은 규칙 (폴더끼리 import 하지 않으므로 복사)
+# 한쪽을 고치면 다른 쪽도 같이 고칠 것
+def normalize_input(text: str) -> str:
+    """Normalize whitespace, case and Hangul jamo so equivalent inputs share a key"""
+    text = unicodedata.normalize("NFKC", text)  # ㄱㅏ → 가, Ｈｅｌｌｏ → Hello
+    text = re.sub(r"\s+", " ", text).strip().casefold()
+    return text.rstrip(".!?~ ")
+
+
+class RouteCache:
+    """LRU of routing decisions with optional SQLite persistence"""
+
+    def __init__(self, max_entries: int = 10_000, sqlite_path: str | None = None):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if sqlite_path:
+            self._conn = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS route_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.commit()
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+        }
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None and self._conn is not None:
+                row = self._conn.execute("SELECT value FROM route_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = row[0]
+                    self._entries[key] = value
+                    self._evict()
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)  # 최근 사용
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, decision):
+        value = json.dumps(decision, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+            if self._conn is not None:
+                self._conn.execute("INSERT OR REPLACE INTO route_cache (key, value) VALUES (?, ?)", (key, value))
+                self._conn.commit()
+
+    def _evict(self):
+        # 메모리에서만 밀어냄 (SQLite에는 남아 있어서 다음에 다시 읽을 수 있음)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def cached_route(cache: RouteCache, *input_keys: str, namespace: str | None = None):
+    """Cache a router node (returns ``{"decision": ...}``) or routing function (returns a Literal)
+
+    input_keys : 키로 쓸 state 필드 (여러 개면 모두 합쳐서 키 생성)
+    namespace  : 라우터마다 결정을 따로 저장 (기본값: 함수 이름)
+    """
+
+    def decorator(router):
+        prefix = namespace or router.__name__
+
+        @functools.wraps(router)
+        def wrapper(state):
+            text = "\n".join(normalize_input(str(state[k])) for k in input_keys)
+            key = f"{prefix}:{text}"
+            decision = cache.get(key)
+            if decision is None:
+                decision = router(state)
+                cache.put(key, decision)
+            return decision
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    import time
+
+    from langgraph.graph import StateGraph, START, END
+
+    from example import State, llm_call_1, llm_call_2, llm_call_3, llm_call_router, route_decision
+
+    cache = RouteCache(max_entries=1000, sqlite_path="route_cache.sqlite")
+
+    # Build workflow (example.py와 동일, 라우터 노드만 캐시로 감쌈)
+    router_builder = StateGraph(State)
+    router_builder.add_node("llm_call_1", llm_call_1)
+    router_builder.add_node("llm_call_2", llm_call_2)
+    router_builder.add_node("llm_call_3", llm_call_3)
+    router_builder.add_node("llm_call_router", cached_route(cache, "input")(llm_call_router))
+    router_builder.add_edge(START, "llm_call_router")
+    router_builder.add_conditional_edges(
+        "llm_call_router",
+        route_decision,
+        {
+            "llm_call_1": "llm_call_1",
+            "llm_call_2": "llm_call_2",
+            "llm_call_3": "llm_call_3",
+        },
+    )
+    router_builder.add_edge("llm_call_1", END)
+    router_builder.add_edge("llm_call_2", END)
+    router_builder.add_edge("llm_call_3", END)
+    cached_router_workflow = router_builder.compile()
+
+    # 공백 / 대소문자 / 문장부호만 다른 입력 → 두 번째부터 캐시 hit
+    for text in ["고양이에 대해 짧은 농담을 적어줘.", "고양이에 대해  짧은 농담을 적어줘", "바다에 대한 시를 써줘"]:
+        start = time.perf_counter()
+        answer = cached_router_workflow.invoke({"input": text})
+        print(f"{text} → {answer['decision']} ({time.perf_counter() - start:.2f}s)")
+
+    print(f"\n캐시: {cache.stats}")
@@ -14,6 +14,9 @@ from typing_extensions import TypedDict, Literal
 from langgraph.graph import StateGraph, START, END
 from langchain.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
+from langgraph.types import Send
+from typing import Annotated
+import operator
 
 load_dotenv()
 llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
@@ -29,6 +32,7 @@ class GradingState(TypedDict):
     retry_count: int
     quality_status: str
     critique: str
+    max_retries: int  # 품질 루프 예산 (없으면 3회)
 
 # ============================================================
 # [핵심 기능 1] Router (라우터) 정의
@@ -123,7 +127,7 @@ def route_decision(state: GradingState):
         return "generate_math_feedback"
 
 def check_quality_loop(state: GradingState):
-    if state["quality_status"] == "PASS" or state["retry_count"] >= 3:
+    if state["quality_status"] == "PASS" or state["retry_count"] >= state.get("max_retries", 3):
         if state["quality_status"] == "FAIL":
             print("   -> [Loop] 최대 재시도 초과. 현재 결과로 종료.")
         else:
@@ -172,64 +176,131 @@ workflow.add_conditional_edges(
 
 app = workflow.compile()
 
-# --- 실행 및 테스트 ---
-
-test_cases = [
-    {
-        "name": "CASE 1: 역사 (병렬 처리 확인)",
-        "question": "임진왜란이 일어난 연도와 그 결과는?",
-        "answer": "1592년에 일어났고, 조선 국토가 황폐화되었다."
-    },
-    {
-        "name": "CASE 2: 수학 (모범 답안)",
-        "question": "이차방정식 x^2 - 5x + 6 = 0 의 해를 구하시오.",
-        "answer": "인수분해하면 (x-2)(x-3)=0 이므로 x=2 또는 x=3 입니다."
-    },
-    {
-        "name": "CASE 3: 수학 (오답 -> 피드백 루프 확인)",
-        "question": "이차방정식 x^2 - 5x + 6 = 0 의 해를 구하시오.",
-        "answer": "잘 모르겠어요. 그냥 1 아닐까요?"
-    }
-]
+# ============================================================
+# [반 단위 채점] 학생 답안마다 채점 워커를 Send로 병렬 실행
+# ============================================================
+class ClassGradingState(TypedDict):
+    submissions: list[dict]  # [{"student_id", "question", "answer"}, ...]
+    max_retries: int  # 학생 한 명당 품질 루프 예산
+    results: Annotated[list, operator.add]  # 워커 결과가 쌓이는 곳 (reducer)
 
-print("--- [LangGraph 심화 패턴 검증 시작] ---\n")
+class StudentState(TypedDict):
+    student_id: str
+    question: str
+    answer: str
+    max_retries: int
 
-for i, case in enumerate(test_cases):
-    print(f"=== [{case['name']}] 실행 중... ===")
-    
-    if i > 0:
-        print("   (API 쿼터 회복을 위해 60초 대기 중...)")
-        time.sleep(60)
+def assign_graders(state: ClassGradingState):
+    return [
+        Send("grade_student", {**sub, "max_retries": state.get("max_retries", 3)})
+        for sub in state["submissions"]
+    ]
 
+def grade_student(state: StudentState):
+    """학생 한 명을 기존 채점 그래프(app)로 채점하고 걸린 시간을 기록"""
+    start = time.perf_counter()
     try:
         result = app.invoke({
-            "question": case['question'],
-            "student_answer": case['answer']
+            "question": state["question"],
+            "student_answer": state["answer"],
+            "max_retries": state["max_retries"],
         })
+        record = {
+            "subject": result["subject"],
+            "grade": result.get("grade"),
+            "retry_count": result.get("retry_count", 0),
+            "quality_status": result.get("quality_status"),
+            "error": None,
+        }
+    except Exception as e:  # 한 학생이 실패해도 반 전체는 계속 진행
+        record = {"error": repr(e)}
+    record.update(student_id=state["student_id"], latency=time.perf_counter() - start)
+    print(f"   -> [반 채점] {state['student_id']} 완료 ({record['latency']:.1f}s)")
+    return {"results": [record]}
+
+class_workflow = StateGraph(ClassGradingState)
+class_workflow.add_node("grade_student", grade_student)
+class_workflow.add_conditional_edges(START, assign_graders, ["grade_student"])
+class_workflow.add_edge("grade_student", END)
+class_app = class_workflow.compile()
 
-        print(f"\n[결과 확인]")
-        print(f"▶ 분류된 과목: {result['subject']}")
+def grade_class(submissions: list[dict], max_workers: int = 4, max_retries: int = 2) -> list[dict]:
+    """반 전체 채점: 동시에 max_workers명까지, 학생당 품질 루프는 max_retries회까지"""
+    result = class_app.invoke(
+        {"submissions": submissions, "max_retries": max_retries},
+        config={"max_concurrency": max_workers},  # 동시에 실행되는 채점 워커 수 상한
+    )
+    return result["results"]
+
+# --- 실행 및 테스트 ---
+
+if __name__ == "__main__":
+    test_cases = [
+        {
+            "name": "CASE 1: 역사 (병렬 처리 확인)",
+            "question": "임진왜란이 일어난 연도와 그 결과는?",
+            "answer": "1592년에 일어났고, 조선 국토가 황폐화되었다."
+        },
+        {
+            "name": "CASE 2: 수학 (모범 답안)",
+            "question": "이차방정식 x^2 - 5x + 6 = 0 의 해를 구하시오.",
+            "answer": "인수분해하면 (x-2)(x-3)=0 이므로 x=2 또는 x=3 입니다."
+        },
+        {
+            "name": "CASE 3: 수학 (오답 -> 피드백 루프 확인)",
+            "question": "이차방정식 x^2 - 5x + 6 = 0 의 해를 구하시오.",
+            "answer": "잘 모르겠어요. 그냥 1 아닐까요?"
+        }
+    ]
+
+    print("--- [LangGraph 심화 패턴 검증 시작] ---\n")
+
+    for i, case in enumerate(test_cases):
+        print(f"=== [{case['name']}] 실행 중... ===")
+    
+        if i > 0:
+            print("   (API 쿼터 회복을 위해 60초 대기 중...)")
+            time.sleep(60)
+
+        try:
+            result = app.invoke({
+                "question": case['question'],
+                "student_answer": case['answer']
+            })
+
+            print(f"\n[결과 확인]")
+            print(f"▶ 분류된 과목: {result['subject']}")
         
-        if result['subject'] == 'history':
-            print("▶ 실행 패턴: 병렬 처리 (Parallel)")
-            print(f"- 채점: {result.get('grade')[:50]}...")
-            print(f"- 오답노트: {result.get('review_note')[:50]}...")
-            print(f"- 암기팁: {result.get('extra_content')[:50]}...")
-        elif result['subject'] == 'math':
-            print("▶ 실행 패턴: 평가-최적화 (Evaluator-Optimizer)")
-            print(f"- 시도 횟수: {result['retry_count']}")
-            print(f"- 품질 상태: {result.get('quality_status')}")
-            print(f"- 최종 피드백:\n{result['grade'][:200]}...")
+            if result['subject'] == 'history':
+                print("▶ 실행 패턴: 병렬 처리 (Parallel)")
+                print(f"- 채점: {result.get('grade')[:50]}...")
+                print(f"- 오답노트: {result.get('review_note')[:50]}...")
+                print(f"- 암기팁: {result.get('extra_content')[:50]}...")
+            elif result['subject'] == 'math':
+                print("▶ 실행 패턴: 평가-최적화 (Evaluator-Optimizer)")
+                print(f"- 시도 횟수: {result['retry_count']}")
+                print(f"- 품질 상태: {result.get('quality_status')}")
+                print(f"- 최종 피드백:\n{result['grade'][:200]}...")
             
-    except Exception as e:
-        error_msg = str(e)
-        # [핵심 기능 4] Quota Management: 에러 메시지 내용을 확인하여 처리
-        if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-            print("\n[ERROR] Google API 쿼터(사용량 제한)가 초과되었습니다.")
-            print("무료 플랜(Free Tier)은 분당/일일 요청 횟수에 제한이 있습니다.")
-            print("잠시 후 다시 실행하거나, 내일 다시 시도해주세요.")
-            break
-        else:
-            print(f"\n[ERROR] 알 수 없는 오류 발생: {e}")
+        except Exception as e:
+            error_msg = str(e)
+            # [핵심 기능 4] Quota Management: 에러 메시지 내용을 확인하여 처리
+            if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
+                print("\n[ERROR] Google API 쿼터(사용량 제한)가 초과되었습니다.")
+                print("무료 플랜(Free Tier)은 분당/일일 요청 횟수에 제한이 있습니다.")
+                print("잠시 후 다시 실행하거나, 내일 다시 시도해주세요.")
+                break
+            else:
+                print(f"\n[ERROR] 알 수 없는 오류 발생: {e}")
     
-    print("-" * 60 + "\n")
+        print("-" * 60 + "\n")
+
+    # 반 단위 채점 (학생 3명, 동시에 2명까지, 학생당 품질 루프 최대 2회)
+    print("=== [반 단위 채점] 실행 중... ===")
+    class_results = grade_class(
+        [{"student_id": f"s{i + 1}", "question": c["question"], "answer": c["answer"]} for i, c in enumerate(test_cases)],
+        max_workers=2,
+        max_retries=2,
+    )
+    for r in sorted(class_results, key=lambda r: r["student_id"]):
+        print(f"- {r['student_id']}: {r.get('subject')} / 시도 {r.get('retry_count')} / {r.get('quality_status')} / {r['latency']:.1f}s")
@@ -0,0 +1,180 @@
+#-------------------------------------
+# Table-driven dispatch: (label → 작업 목록) 표 하나로 라우팅 + fan-out
+#-------------------------------------
+"""
+submissions/bjy.py 는 감정 4개 × 작업 3개 = 12개의 노드 함수를 손으로 만들고
+감정마다 3개씩 노드를 이어 붙인다. 감정(label)이 늘어날수록 그래프가 커지고
+컴파일 / mermaid 그리기도 느려진다.
+
+여기서는 라우팅 표를 데이터로 두고,
+- 분류 노드 1개
+- 파라미터로 일을 받는 worker 노드 1개 (Send로 label의 작업 수만큼 fan-out)
+- aggregator 노드 1개
+로만 그래프를 만든다. label이 몇 개든 그래프 크기는 같다.
+
+python table_dispatch.py --fake   # 손으로 만든 bjy 그래프와 컴파일/실행 시간 비교
+"""
+
+from typing_extensions import TypedDict
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
+
+
+class Handler(TypedDict):
+    output_key: str  # 결과를 쓸 state 필드
+    title: str  # 결과 앞에 붙일 제목
+    prompt: str  # LLM 프롬프트
+
+
+class WorkerState(TypedDict):
+    handler: Handler
+
+
+# bjy.py 의 recommend_music_* / recommend_quote_* / give_advice_* 를 표로 옮긴 것
+EMOTION_TABLE: dict[str, list[Handler]] = {
+    "happy": [
+        {"output_key": "music_recommendation", "title": "🎵 신나는 플레이리스트",
+         "prompt": "기분이 좋을 때 들으면 더 신나는 K-POP 노래 3곡을 추천해줘. 곡명과 아티스트, 한 줄 설명으로."},
+        {"output_key": "quote_recommendation", "title": "📜 오늘의 명언",
+         "prompt": "행복한 순간을 더 특별하게 만들어주는 명언 2개를 추천해줘. 명언과 말한 사람을 포함해서."},
+        {"output_key": "advice", "title": "💡 오늘의 조언",
+         "prompt": "기분 좋은 하루를 더 알차게 보내는 방법을 짧게 조언해줘."},
+    ],
+    "sad": [
+        {"output_key": "music_recommendation", "title": "🎵 위로의 플레이리스트",
+         "prompt": "우울할 때 위로가 되는 잔잔한 발라드 3곡을 추천해줘. 곡명과 아티스트, 한 줄 설명으로."},
+        {"output_key": "quote_recommendation", "title": "📜 위로의 명언",
+         "prompt": "슬플 때 마음을 달래주는 위로의 명언 2개를 추천해줘. 명언과 말한 사람을 포함해서."},
+        {"output_key": "advice", "title": "💡 오늘의 조언",
+         "prompt": "우울한 기분을 달래는 구체적인 방법을 짧게 조언해줘. 공감과 위로를 담아서."},
+    ],
+    "angry": [
+        {"output_key": "music_recommendation", "title": "🎵 스트레스 해소 플레이리스트",
+         "prompt": "화가 날 때 스트레스 해소되는 강렬한 록/힙합 노래 3곡을 추천해줘. 곡명과 아티스트, 한 줄 설명으로."},
+        {"output_key": "quote_recommendation", "title": "📜 진정의 명언",
+         "prompt": "화가 날 때 마음을 가라앉히는 명언 2개를 추천해줘. 분노 조절이나 인내에 관한 것으로."},
+        {"output_key": "advice", "title": "💡 오늘의 조언",
+         "prompt": "화가 났을 때 진정하고 상황을 해결하는 방법을 짧게 조언해줘."},
+    ],
+    "tired": [
+        {"output_key": "music_recommendation", "title": "🎵 힐링 플레이리스트",
+         "prompt": "피곤할 때 편안하게 쉴 수 있는 Lo-Fi/재즈 음악 3곡을 추천해줘. 곡명과 아티스트, 한 줄 설명으로."},
+        {"output_key": "quote_recommendation", "title": "📜 에너지 충전 명언",
+         "prompt": "지쳤을 때 다시 힘을 주는 동기부여 명언 2개를 추천해줘. 명언과 말한 사람을 포함해서."},
+        {"output_key": "advice", "title": "💡 오늘의 조언",
+         "prompt": "피곤할 때 효과적으로 에너지를 충전하는 방법을 짧게 조언해줘."},
+    ],
+}
+
+
+def build_table_router(state_schema, classifier, label_key: str, table: dict[str, list[Handler]], aggregator, llm, default_label: str | None = None):
+    """Compile classifier → (Send fan-out to one worker) → aggregator
+
+    state_schema  : 그래프 State (handler의 output_key 필드를 모두 포함해야 함)
+    classifier    : state[label_key]에 label을 쓰는 노드
+    table         : label → 그 label에서 실행할 Handler 목록
+    default_label : 표에 없는 label이 나왔을 때 사용할 label
+    """
+
+    def worker(state: WorkerState):
+        """Run one handler from the table"""
+        handler = state["handler"]
+        msg = llm.invoke(handler["prompt"])
+        return {handler["output_key"]: f"{handler['title']}\n{msg.content}"}
+
+    def dispatch(state):
+        label = state[label_key]
+        handlers = table.get(label) or table[default_label or next(iter(table))]
+        return [Send("worker", {"handler": h}) for h in handlers]
+
+    builder = StateGraph(state_schema)
+    builder.add_node("classifier", classifier)
+    builder.add_node("worker", worker)
+    builder.add_node("aggregator", aggregator)
+
+    builder.add_edge(START, "classifier")
+    builder.add_conditional_edges("classifier", dispatch, ["worker"])
+    builder.add_edge("worker", "aggregator")
+    builder.add_edge("aggregator", END)
+    return builder.compile()
+
+
+if __name__ == "__main__":
+    import argparse
+    import importlib.util
+    import time
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description="Hand-written vs table-driven emotion routing")
+    parser.add_argument("--fake", action="store_true", help="가짜 모델 사용 (API 호출 없음)")
+    parser.add_argument("--compiles", type=int, default=20)  # 컴파일 반복 횟수
+    parser.add_argument("--invokes", type=int, default=20)  # 실행 반복 횟수
+    args = parser.parse_args()
+
+    # 손으로 만든 그래프 (submissions/bjy.py)
+    spec = importlib.util.spec_from_file_location("bjy", Path(__file__).parent / "submissions" / "bjy.py")
+    bjy = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bjy)
+
+    if args.fake:
+        import os
+
+        import langsmith.utils
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+        # bjy.py 가 LANGCHAIN_TRACING_V2=true 로 켜 두므로, 가짜 모델 측정 중에는 LangSmith 전송도 끔
+        # (langsmith는 환경 변수 값을 캐시하므로 캐시도 비움)
+        os.environ["LANGCHAIN_TRACING_V2"] = "false"
+        os.environ["LANGSMITH_TRACING"] = "false"
+        langsmith.utils.get_env_var.cache_clear()
+
+        class FakeEmotionRouter:
+            def invoke(self, prompt):
+                return bjy.EmotionRoute(emotion="tired", reason="가짜 분류기")
+
+        bjy.llm = FakeListChatModel(responses=["추천 결과"])
+        bjy.emotion_router = FakeEmotionRouter()
+
+    def build_table():
+        return build_table_router(
+            bjy.EmotionState, bjy.emotion_classifier, "emotion", EMOTION_TABLE, bjy.aggregate_results, bjy.llm, "happy"
+        )
+
+    table_workflow = build_table()
+
+    def timeit(fn, n):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - start) / n * 1000
+
+    def graph_size(graph):
+        g = graph.get_graph()
+        return len(g.nodes), len(g.edges)
+
+    print(f"{'':<14} {'nodes':>6} {'edges':>6} {'compile':>10} {'draw':>10} {'invoke':>10}")
+    for name, builder_fn, graph in [
+        ("hand-written", bjy.builder.compile, bjy.emotion_workflow),
+        ("table-driven", build_table, table_workflow),
+    ]:
+        nodes, edges = graph_size(graph)
+        compile_ms = timeit(builder_fn, args.compiles)
+        draw_ms = timeit(lambda: graph.get_graph(xray=True).draw_mermaid(), args.compiles)
+        invoke_ms = timeit(lambda: graph.invoke({"user_input": "오늘 너무 피곤해"}), args.invokes)
+        print(f"{name:<14} {nodes:>6} {edges:>6} {compile_ms:>8.2f}ms {draw_ms:>8.2f}ms {invoke_ms:>8.2f}ms")
+    print(
+        "* invoke는 같은 조건의 비교가 아님: hand-written은 작업 3개를 노드 체인으로 순서대로,\n"
+        "  table-driven은 Send로 동시에 실행한다 (실제 모델에서는 차이가 대부분 이 병렬 실행에서 나옴)"
+    )
+
+    # label 수를 늘렸을 때 (표만 늘어나고 그래프는 그대로)
+    print("\nlabel 수를 늘린 표 (table-driven):")
+    for n_labels in (4, 16, 64):
+        big_table = {f"label_{i}": EMOTION_TABLE["happy"] for i in range(n_labels)}
+        build = lambda: build_table_router(
+            bjy.EmotionState, bjy.emotion_classifier, "emotion", big_table, bjy.aggregate_results, bjy.llm, "label_0"
+        )
+        nodes, edges = graph_size(build())
+        print(f"  labels={n_labels:<3} nodes={nodes} edges={edges} compile={timeit(build, args.compiles):.2f}ms")
+
+    print("\n" + table_workflow.invoke({"user_input": "오늘 너무 피곤해"})["final_output"])
@@ -146,12 +146,13 @@ orchestrator_worker_builder.add_edge("synthesizer", END)
 # Compile the workflow
 orchestrator_worker = orchestrator_worker_builder.compile()
 
-# Show the workflow
-print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
-print(orchestrator_worker.get_graph(xray=True).draw_mermaid())
+if __name__ == "__main__":
+    # Show the workflow
+    print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
+    print(orchestrator_worker.get_graph(xray=True).draw_mermaid())
 
-# Invoke
-state = orchestrator_worker.invoke({"topic": "LLM 스케일링 법칙에 관한 보고서 짧게 작성"})
+    # Invoke
+    state = orchestrator_worker.invoke({"topic": "LLM 스케일링 법칙에 관한 보고서 짧게 작성"})
 
-text = state["final_report"] or ""
-print(f"\n[synthesizer] 완료: {len(text)} chars\n")
\ No newline at end of file
+    text = state["final_report"] or ""
+    print(f"\n[synthesizer] 완료: {len(text)} chars\n")
\ No newline at end of file
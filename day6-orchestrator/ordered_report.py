@@ -0,0 +1,138 @@
+#-------------------------------------
+# Ordered streaming report: 계획한 순서대로 섹션을 놓고, 앞부분부터 바로 내보낸다
+#-------------------------------------
+"""
+example.py 의 completed_sections는 operator.add 리스트라서 Send(task) 순서대로 합쳐진다.
+섹션 순서가 "Send를 계획 순서대로 보낸다"는 암묵적인 약속에만 기대고 있고,
+synthesizer는 워커가 모두 끝나야 실행되므로 가장 느린 섹션 하나가 전체를 붙잡는다.
+
+1) merge_sections (인덱스 리듀서)
+   - 워커가 {계획 순번: 섹션} 을 쓰고, 리듀서가 dict로 합친다
+   - 순서를 리스트 위치가 아니라 명시적인 순번으로 가지고 있으므로
+     Send 순서를 바꾸거나(우선순위 스케줄링 등), 재시도/체크포인트에서 이어서 실행해
+     섹션이 다시 쓰여도 각 섹션은 자기 자리에 들어간다 (같은 순번은 덮어씀, 중복 없음)
+2) 스트리밍 synthesizer 모드 (context=ReportPrefix())
+   - 0번부터 빈틈없이 끝난 섹션이 늘어날 때마다 그만큼을 custom 스트림으로 내보낸다
+   - 첫 섹션이 보이는 시간 = 0번 섹션이 끝나는 시간 (가장 느린 워커와 무관)
+
+워커들은 같은 super-step에서 병렬로 돌아 서로의 state를 볼 수 없으므로
+day4 streaming_aggregator.py 처럼 실행마다 런타임 context 하나에 완료된 섹션을 모은다.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Annotated
+
+from typing_extensions import TypedDict
+from langgraph.graph import StateGraph, START, END
+from langgraph.runtime import Runtime
+from langgraph.types import Send
+
+from example import Section, orchestrator, llm_call
+
+SEPARATOR = "\n\n---\n\n"  # example.py synthesizer와 같은 구분선
+
+
+def merge_sections(left: dict[int, str] | None, right: dict[int, str] | None) -> dict[int, str]:
+    """Reducer: place each section at its planned index"""
+    return {**(left or {}), **(right or {})}
+
+
+# 그래프 상태 (completed_sections만 인덱스 dict로 바뀜)
+class OrderedState(TypedDict):
+    topic: str  # 주제
+    sections: list[Section]  # orchestrator가 만든 섹션 계획
+    completed_sections: Annotated[dict[int, str], merge_sections]  # 계획 순번 → 섹션 결과
+    final_report: str  # 최종 리포트
+
+
+# 워커 상태
+class OrderedWorkerState(TypedDict):
+    index: int  # 계획에서의 순번
+    section: Section
+
+
+@dataclass
+class ReportPrefix:
+    """Per-run collector that releases the contiguous report prefix (pass as ``context=ReportPrefix()``)"""
+
+    parts: dict[int, str] = field(default_factory=dict)
+    emitted: int = 0  # 지금까지 내보낸 앞부분 섹션 수
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, index: int, text: str) -> list[str]:
+        """Record a section; return the sections that just joined the prefix"""
+        with self.lock:  # sync 워커는 스레드에서 동시에 실행됨
+            self.parts[index] = text
+            ready = []
+            while self.emitted in self.parts:
+                ready.append(self.parts[self.emitted])
+                self.emitted += 1
+            return ready
+
+
+# Nodes: orchestrator 노드 (example.py 것을 그대로 호출, state 타입만 OrderedState)
+def ordered_orchestrator(state: OrderedState):
+    """Orchestrator that generates a plan for the report in Korean"""
+    return orchestrator(state)
+
+
+# Nodes: llm_call 노드 (순번과 함께 결과 기록)
+def ordered_llm_call(state: OrderedWorkerState, runtime: Runtime[ReportPrefix]):
+    """Worker writes one section and files it under its planned index"""
+
+    text = llm_call({"section": state["section"]})["completed_sections"][0]
+
+    if runtime.context is not None:  # 스트리밍 모드
+        ready = runtime.context.add(state["index"], text)
+        if ready:
+            runtime.stream_writer({"sections": ready, "prefix_length": runtime.context.emitted})
+
+    return {"completed_sections": {state["index"]: text}}
+
+
+# Nodes: synthesizer 노드 (계획 순서대로 합치기)
+def ordered_synthesizer(state: OrderedState):
+    """Synthesize full report from sections in planned order"""
+
+    completed = state["completed_sections"]
+    return {"final_report": SEPARATOR.join(completed[i] for i in sorted(completed))}
+
+
+# assign_workers (순번을 같이 보냄)
+def assign_workers(state: OrderedState):
+    """Assign a worker to each section, tagged with its position in the plan"""
+
+    print(f"[DISPATCH] 워커 {len(state['sections'])}개 생성\n")
+    return [Send("llm_call", {"index": i, "section": s}) for i, s in enumerate(state["sections"])]
+
+
+# Build workflow (구조는 example.py와 동일)
+ordered_builder = StateGraph(OrderedState, context_schema=ReportPrefix)
+
+ordered_builder.add_node("orchestrator", ordered_orchestrator)
+ordered_builder.add_node("llm_call", ordered_llm_call)
+ordered_builder.add_node("synthesizer", ordered_synthesizer)
+
+ordered_builder.add_edge(START, "orchestrator")
+ordered_builder.add_conditional_edges("orchestrator", assign_workers, ["llm_call"])
+ordered_builder.add_edge("llm_call", "synthesizer")
+ordered_builder.add_edge("synthesizer", END)
+
+ordered_orchestrator_worker = ordered_builder.compile()
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    for mode, chunk in ordered_orchestrator_worker.stream(
+        {"topic": "LLM 스케일링 법칙에 관한 보고서 짧게 작성"},
+        context=ReportPrefix(),  # 실행마다 새로 만들기
+        stream_mode=["custom", "values"],
+    ):
+        if mode == "custom":
+            print(f"\n===== 섹션 1~{chunk['prefix_length']} 준비됨 ({time.perf_counter() - start:.2f}s) =====")
+            print(SEPARATOR.join(chunk["sections"]))
+        elif chunk.get("final_report"):
+            print(f"\n[synthesizer] 완료: {len(chunk['final_report'])} chars ({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,201 @@
+#-------------------------------------
+# Plan cache: 주제 → 섹션 계획(Sections) 캐시 (정확히 일치 + 비슷한 주제)
+#-------------------------------------
+"""
+example.py 의 orchestrator는 주제가 거의 같아도 매번 planner.invoke로 계획을 새로 만든다.
+같은 보고서를 다시 요청하면 계획 단계의 LLM 왕복을 건너뛴다.
+
+1) 정확히 일치 : 정규화한 주제(NFKC, 대소문자, 공백, 끝 문장부호)가 같으면 hit
+2) 비슷한 주제 : (선택, 기본은 꺼짐) 예전에 계획한 주제들과 문자 n-gram 코사인 유사도를 계산해서
+                 similarity_threshold 이상인 것 중 가장 비슷한 계획을 사용
+                 - 숫자가 다르거나("3.11" / "3.12", "2023년" / "2024년")
+                   조사 차이가 아닌 다른 단어가 있으면("짧게" / "길게") 유사도가 높아도 쓰지 않음
+                 - 워커는 섹션 이름만 받으므로 잘못 고른 계획은 다른 주제의 보고서가 됨 → 기본값 None
+저장          : SQLite 파일 (스크립트를 다시 실행해도 유지, 처음 get/put 할 때 열림)
+
+    cache = PlanCache("plan_cache.sqlite")                                # 정확히 일치만
+    cache = PlanCache("plan_cache.sqlite", similarity_threshold=0.85)     # 비슷한 주제도
+    cached = cached_orchestrator(cache)  # orchestrator 노드 대신 사용
+"""
+
+import json
+import math
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import Counter
+
+from langgraph.graph import StateGraph, START, END
+
+from example import State, Sections, orchestrator, llm_call, synthesizer, assign_workers
+
+
+# day5-routing/route_cache.py 의 normalize_input 과 같은 규칙 (폴더끼리 import 하지 않으므로 복사)
+# 한쪽을 고치면 다른 쪽도 같이 고칠 것
+def normalize_topic(topic: str) -> str:
+    """Normalize unicode, case and whitespace so equivalent topics share a key"""
+    topic = unicodedata.normalize("NFKC", topic)
+    topic = re.sub(r"\s+", " ", topic).strip().casefold()
+    return topic.rstrip(".!?~ ")
+
+
+def ngram_vector(text: str, sizes=(2, 3)) -> tuple[Counter, float]:
+    """Character n-gram counts and their L2 norm"""
+    padded = f" {text} "
+    grams = Counter(padded[i:i + n] for n in sizes for i in range(len(padded) - n + 1))
+    return grams, math.sqrt(sum(c * c for c in grams.values()))
+
+
+def same_terms(a: str, b: str) -> bool:
+    """Same numbers, and every other word matches up to a trailing particle (보고서 / 보고서를)"""
+    words_a, words_b = set(re.findall(r"\w+", a)), set(re.findall(r"\w+", b))
+    if set(re.findall(r"\d+", a)) != set(re.findall(r"\d+", b)):
+        return False
+    for word, others in [(w, words_b) for w in words_a - words_b] + [(w, words_a) for w in words_b - words_a]:
+        if not any(word.startswith(o) or o.startswith(word) for o in others):
+            return False
+    return True
+
+
+def cosine(a: tuple[Counter, float], b: tuple[Counter, float]) -> float:
+    (va, na), (vb, nb) = a, b
+    if not na or not nb:
+        return 0.0
+    if len(va) > len(vb):
+        va, vb = vb, va  # 작은 쪽을 순회
+    return sum(c * vb[g] for g, c in va.items()) / (na * nb)
+
+
+class PlanCache:
+    """Topic → Sections plan, with exact and n-gram similarity lookup, persisted in SQLite"""
+
+    def __init__(self, path: str = "plan_cache.sqlite", similarity_threshold: float | None = None):
+        self.similarity_threshold = similarity_threshold
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None  # import만 해서는 파일을 만들지 않도록 처음 쓸 때 연결
+        self._plans: dict[str, str] = {}
+        self._vectors: dict[str, tuple[Counter, float]] = {}
+
+    def _open(self) -> sqlite3.Connection:
+        """Connect on first use and load stored plans (call with self._lock held)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS plan_cache (key TEXT PRIMARY KEY, plan TEXT NOT NULL)")
+            self._conn.commit()
+
+            # 유사도 검색용: 저장된 주제 전부를 메모리에 벡터로 올려 둠
+            for key, plan in self._conn.execute("SELECT key, plan FROM plan_cache"):
+                self._plans[key] = plan
+                self._vectors[key] = ngram_vector(key)
+        return self._conn
+
+    @property
+    def stats(self) -> dict:
+        total = self.exact_hits + self.similar_hits + self.misses
+        hits = self.exact_hits + self.similar_hits
+        return {
+            "exact_hits": self.exact_hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+            "size": len(self._plans),
+        }
+
+    def get(self, topic: str) -> Sections | None:
+        key = normalize_topic(topic)
+        with self._lock:
+            self._open()
+            plan = self._plans.get(key)
+            if plan is not None:
+                self.exact_hits += 1
+                return Sections.model_validate_json(plan)
+
+            if self.similarity_threshold is not None:
+                vector = ngram_vector(key)
+                best_key, best_score = max(
+                    ((k, cosine(vector, v)) for k, v in self._vectors.items() if same_terms(key, k)),
+                    key=lambda kv: kv[1],
+                    default=(None, 0.0),
+                )
+                if best_key is not None and best_score >= self.similarity_threshold:
+                    self.similar_hits += 1
+                    print(f"[PLAN CACHE] 비슷한 주제 사용 ({best_score:.2f}): {best_key}")
+                    return Sections.model_validate_json(self._plans[best_key])
+
+            self.misses += 1
+        return None
+
+    def put(self, topic: str, plan: Sections):
+        key = normalize_topic(topic)
+        value = plan.model_dump_json()
+        with self._lock:
+            conn = self._open()
+            self._plans[key] = value
+            self._vectors[key] = ngram_vector(key)
+            conn.execute("INSERT OR REPLACE INTO plan_cache (key, plan) VALUES (?, ?)", (key, value))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._open()
+            self._plans.clear()
+            self._vectors.clear()
+            conn.execute("DELETE FROM plan_cache")
+            conn.commit()
+
+
+def cached_orchestrator(cache: PlanCache):
+    """Wrap the orchestrator node so cached plans skip the planner call"""
+
+    def node(state: State):
+        """Orchestrator that reuses a cached plan for the same (or a similar) topic"""
+        plan = cache.get(state["topic"])
+        if plan is not None:
+            titles = [s.name for s in plan.sections]
+            print(f"\n[PLAN] (캐시) 섹션 {len(titles)}개: {', '.join(titles)}\n")
+            return {"sections": plan.sections}
+
+        update = orchestrator(state)
+        cache.put(state["topic"], Sections(sections=update["sections"]))
+        return update
+
+    node.__name__ = orchestrator.__name__
+    return node
+
+
+plan_cache = PlanCache("plan_cache.sqlite")  # 정확히 일치만. 파일은 첫 실행 때 생김 (*.sqlite 는 .gitignore)
+
+# Build workflow (example.py와 동일, orchestrator 노드만 캐시로 감쌈)
+cached_builder = StateGraph(State)
+
+cached_builder.add_node("orchestrator", cached_orchestrator(plan_cache))
+cached_builder.add_node("llm_call", llm_call)
+cached_builder.add_node("synthesizer", synthesizer)
+
+cached_builder.add_edge(START, "orchestrator")
+cached_builder.add_conditional_edges("orchestrator", assign_workers, ["llm_call"])
+cached_builder.add_edge("llm_call", "synthesizer")
+cached_builder.add_edge("synthesizer", END)
+
+cached_orchestrator_worker = cached_builder.compile()
+
+
+if __name__ == "__main__":
+    import time
+
+    # 두 번째는 정확히 일치(공백/문장부호 차이), 세 번째는 비슷한 주제 (similarity_threshold를 켜야 hit)
+    for topic in [
+        "LLM 스케일링 법칙에 관한 보고서 짧게 작성",
+        "LLM 스케일링 법칙에 관한  보고서 짧게 작성.",
+        "LLM 스케일링 법칙에 관한 보고서를 짧게 작성",
+    ]:
+        start = time.perf_counter()
+        state = cached_orchestrator_worker.invoke({"topic": topic})
+        print(f"[synthesizer] 완료: {len(state['final_report'] or '')} chars ({time.perf_counter() - start:.2f}s)\n")
+
+    print(f"캐시: {json.dumps(plan_cache.stats, ensure_ascii=False)}")
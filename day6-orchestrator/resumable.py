@@ -0,0 +1,107 @@
+#-------------------------------------
+# Resumable orchestrator: 실패한 섹션만 다시 실행
+#-------------------------------------
+"""
+example.py 에서는 llm_call 워커 하나만 실패해도 orchestrator_worker.invoke 전체가 실패하고,
+다시 실행하면 계획 + 모든 섹션을 처음부터 새로 만든다.
+
+- RetryPolicy    : llm_call 워커마다 일시적인 오류(연결 오류, 5xx 등)를 backoff로 재시도
+- checkpointer   : 같은 super-step에서 성공한 워커 결과(pending writes)는 체크포인트에 남는다
+- resume_report  : invoke(None, config)로 이어서 실행 → 실패한 Send 작업만 다시 돌고
+                   끝난 섹션, 계획(orchestrator)은 다시 만들지 않음
+
+    state = run_report("LLM 스케일링 법칙", thread_id="report-1")
+    if state is None:                      # 재시도 후에도 실패한 섹션이 있음
+        print(report_status("report-1"))
+        state = resume_report("report-1")  # 빠진 섹션만 다시 생성
+"""
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import RetryPolicy
+
+from example import State, orchestrator, llm_call, synthesizer, assign_workers
+
+# 워커 재시도: 1s → 2s → 4s (+ jitter), 최대 4번 시도
+WORKER_RETRY = RetryPolicy(max_attempts=4, initial_interval=1.0, backoff_factor=2.0, max_interval=30.0, jitter=True)
+
+# 체크포인트에 들어가는 Section(Pydantic) 복원 허용
+checkpointer = InMemorySaver(serde=JsonPlusSerializer(allowed_msgpack_modules=[("example", "Section")]))
+
+# Build workflow (example.py와 동일, 워커 재시도 + checkpointer 추가)
+resumable_builder = StateGraph(State)
+
+resumable_builder.add_node("orchestrator", orchestrator)
+resumable_builder.add_node("llm_call", llm_call, retry_policy=WORKER_RETRY)
+resumable_builder.add_node("synthesizer", synthesizer)
+
+resumable_builder.add_edge(START, "orchestrator")
+resumable_builder.add_conditional_edges("orchestrator", assign_workers, ["llm_call"])
+resumable_builder.add_edge("llm_call", "synthesizer")
+resumable_builder.add_edge("synthesizer", END)
+
+resumable_orchestrator_worker = resumable_builder.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def report_status(thread_id: str) -> dict:
+    """Which sections are done and which failed in the last (interrupted) run"""
+
+    snapshot = resumable_orchestrator_worker.get_state(_config(thread_id))
+    sections = snapshot.values.get("sections", [])
+    done, failed = [], []
+    for task in snapshot.tasks:
+        if task.name != "llm_call":
+            continue
+        # Send 작업의 path = ("__pregel_push", Send 순번, ...) → 계획의 섹션 순번
+        name = sections[task.path[1]].name
+        if task.error:
+            failed.append({"section": name, "error": task.error})
+        elif task.result is not None:
+            done.append(name)
+    return {"done": done, "failed": failed, "next": list(snapshot.next)}
+
+
+def run_report(topic: str, thread_id: str) -> dict | None:
+    """Run a report; None if some sections still failed after retries"""
+
+    try:
+        return resumable_orchestrator_worker.invoke({"topic": topic}, _config(thread_id))
+    except Exception as e:
+        print(f"[RESUMABLE] 실행 중단: {e!r}")
+        return None
+
+
+def resume_report(thread_id: str) -> dict | None:
+    """Continue an interrupted run; only the missing sections are generated again"""
+
+    status = report_status(thread_id)
+    if not status["next"]:
+        print("[RESUMABLE] 이어서 실행할 작업이 없음")
+        return resumable_orchestrator_worker.get_state(_config(thread_id)).values
+    print(f"[RESUMABLE] 완료 {len(status['done'])}개 유지, 다시 실행: {[f['section'] for f in status['failed']]}")
+
+    try:
+        return resumable_orchestrator_worker.invoke(None, _config(thread_id))
+    except Exception as e:
+        print(f"[RESUMABLE] 실행 중단: {e!r}")
+        return None
+
+
+if __name__ == "__main__":
+    thread_id = "report-1"
+    state = run_report("LLM 스케일링 법칙에 관한 보고서 짧게 작성", thread_id)
+
+    attempts = 1
+    while state is None and attempts < 3:  # 재시도 후에도 실패한 섹션이 있으면 그 부분만 이어서
+        print(report_status(thread_id))
+        state = resume_report(thread_id)
+        attempts += 1
+
+    if state is not None:
+        text = state["final_report"] or ""
+        print(f"\n[synthesizer] 완료: {len(text)} chars\n")
@@ -0,0 +1,187 @@
+#-------------------------------------
+# Send 워커 스케줄러: 동시 실행 상한 + 긴 섹션 먼저 + 워커별 마감 시간
+#-------------------------------------
+"""
+example.py 의 assign_workers는 섹션마다 Send("llm_call", ...)를 만들고 전부 한 번에 시작한다.
+섹션이 30개를 넘으면 provider 동시 요청 한도를 넘기 쉽다.
+
+WorkerScheduler
+- max_concurrency : 동시에 LLM을 호출하는 워커 수 상한 (여러 실행이 같이 공유)
+- priority        : 예상 길이가 긴 섹션부터 시작 (가장 긴 작업이 마지막에 혼자 도는 시간을 줄임)
+                    순서는 acquire 안에서만 바뀌고, Send는 계획 순서 그대로 → 보고서 섹션 순서 유지
+- max_wait        : 워커마다 대기열에서 기다릴 수 있는 시간 (각자 대기열에 들어간 시각부터). 지나면 건너뜀
+- timeout         : 워커마다 LLM 호출 시간 상한 (각자 슬롯을 받은 시각부터)
+- metrics         : 대기열 깊이, 워커 사용률(utilization), 대기 시간
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+from langchain.messages import HumanMessage, SystemMessage
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
+
+from example import llm, State, WorkerState, Section, orchestrator, synthesizer
+
+
+class WorkerScheduler:
+    """Priority-ordered slots with a concurrency cap and per-worker wait limits, shared across threads"""
+
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
+        self._cond = threading.Condition()
+        self._queue = []  # (-priority, 순번) 힙: priority가 큰 것부터
+        self._seq = itertools.count()
+        self._active = 0
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.expired = 0
+        self.busy_seconds = 0.0  # 워커들이 슬롯을 잡고 있던 시간의 합
+        self.wait_seconds = []  # 워커별 대기 시간
+        self._first_start = None
+        self._last_end = None
+
+    def acquire(self, priority: float, max_wait: float | None = None) -> bool:
+        """Block until this worker may run; False if it waited longer than max_wait"""
+        enqueued = time.time()
+        deadline = None if max_wait is None else enqueued + max_wait
+        with self._cond:
+            entry = (-priority, next(self._seq))
+            heapq.heappush(self._queue, entry)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+            # 내 차례(힙의 맨 앞)이고 빈 자리가 있을 때까지 대기
+            while not (self._queue[0] == entry and self._active < self.max_concurrency):
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    self.expired += 1
+                    self._cond.notify_all()  # 맨 앞이 바뀌었을 수 있음
+                    return False
+                self._cond.wait(remaining)
+
+            heapq.heappop(self._queue)
+            self._active += 1
+            now = time.time()
+            self.wait_seconds.append(now - enqueued)
+            if self._first_start is None:
+                self._first_start = now
+            self._cond.notify_all()  # 다음 순서가 빈 자리를 확인하도록
+        return True
+
+    def release(self, started: float):
+        with self._cond:
+            self._active -= 1
+            self.completed += 1
+            self._last_end = time.time()
+            self.busy_seconds += self._last_end - started
+            self._cond.notify_all()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> dict:
+        span = (self._last_end or time.time()) - (self._first_start or time.time())
+        waits = sorted(self.wait_seconds)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "expired": self.expired,
+            # 상한만큼의 자리가 실행 시간 동안 얼마나 채워져 있었는지
+            "utilization": self.busy_seconds / (self.max_concurrency * span) if span > 0 else 0.0,
+            "wait_p50": waits[len(waits) // 2] if waits else 0.0,
+            "wait_max": waits[-1] if waits else 0.0,
+        }
+
+
+scheduler = WorkerScheduler(max_concurrency=8)
+WORKER_MAX_WAIT = 120  # 워커 하나가 대기열에서 기다릴 수 있는 최대 시간(초)
+WORKER_TIMEOUT = 60  # 워커 하나의 LLM 호출 시간 상한(초)
+
+
+def expected_length(section: Section) -> float:
+    """Rough size estimate used as priority (longer description → longer section)"""
+    return len(section.name) + len(section.description)
+
+
+# 워커 상태 (우선순위 추가)
+class ScheduledWorkerState(WorkerState):
+    priority: float
+
+
+# Nodes: llm_call 노드 (스케줄러 슬롯을 받은 뒤 실행)
+def llm_call(state: ScheduledWorkerState):
+    """Worker writes a section of the report in Korean, once the scheduler admits it"""
+
+    section = state["section"]
+    if not scheduler.acquire(state["priority"], WORKER_MAX_WAIT):
+        print(f"[WORKER] 대기 시간 초과로 생략: {section.name}")
+        return {"completed_sections": [f"## {section.name}\n\n(대기 시간 초과로 생략)"]}
+
+    started = time.time()
+    try:
+        result = llm.invoke(
+            [
+                SystemMessage(
+                    content="제공된 이름과 설명에 따라 보고서 섹션을 작성하십시오. 각 섹션에 서문은 포함하지 마십시오. 마크다운 서식을 사용하십시오."
+                ),
+                HumanMessage(
+                    content=f"섹션 이름: {section.name} / 설명: {section.description}"
+                ),
+            ],
+            timeout=WORKER_TIMEOUT,  # 슬롯을 받은 시각부터 재는 워커별 상한
+        )
+    finally:
+        scheduler.release(started)
+
+    print(f"[WORKER] 완료: {section.name} ({len(result.content or '')} chars, 대기열 {scheduler.queue_depth})")
+    return {"completed_sections": [result.content]}
+
+
+# assign_workers (우선순위와 함께 Send)
+def assign_workers(state: State):
+    """Assign a worker to each section; the scheduler starts the longest expected ones first"""
+
+    sections = state["sections"]
+    print(f"[DISPATCH] 워커 {len(sections)}개 (동시 {scheduler.max_concurrency}개)\n")
+
+    # completed_sections(operator.add)는 Send 순서대로 합쳐지므로 계획 순서 그대로 보냄
+    # 실행 순서는 scheduler.acquire 의 priority로만 정함
+    return [Send("llm_call", {"section": s, "priority": expected_length(s)}) for s in sections]
+
+
+# Build workflow (example.py와 동일, 워커와 assign_workers만 교체)
+scheduled_builder = StateGraph(State)
+
+scheduled_builder.add_node("orchestrator", orchestrator)
+scheduled_builder.add_node("llm_call", llm_call)
+scheduled_builder.add_node("synthesizer", synthesizer)
+
+scheduled_builder.add_edge(START, "orchestrator")
+scheduled_builder.add_conditional_edges("orchestrator", assign_workers, ["llm_call"])
+scheduled_builder.add_edge("llm_call", "synthesizer")
+scheduled_builder.add_edge("synthesizer", END)
+
+scheduled_orchestrator_worker = scheduled_builder.compile()
+
+
+if __name__ == "__main__":
+    state = scheduled_orchestrator_worker.invoke(
+        {"topic": "LLM 스케일링 법칙에 관한 30개 섹션짜리 상세 보고서 작성"},
+        # 스레드 풀은 섹션 수보다 넉넉하게: 모든 워커가 대기열에 들어와야 priority 순서가 적용됨
+        # 실제 동시 호출 수는 scheduler가 제한
+        config={"max_concurrency": 64},
+    )
+
+    text = state["final_report"] or ""
+    print(f"\n[synthesizer] 완료: {len(text)} chars")
+    print(f"[SCHEDULER] {scheduler.metrics()}")
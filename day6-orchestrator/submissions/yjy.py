@@ -7,20 +7,26 @@
 # 3. Dynamic Parallelism (Send): 동적 워커 생성 (Map)
 # 4. Cycle/Loop (Reflexion): 점수 기반의 자기 교정 루프
 # 5. Aggregation (Reducer): 결과 취합 및 리포트 생성
+# 6. Budget (Runtime Context): 전체 워커가 공유하는 LLM 호출/토큰/시간 예산
 # ============================================================
 
 import operator
+import threading
+import time
 from typing import Annotated, List, TypedDict, Optional
 from typing_extensions import Literal
 from dotenv import load_dotenv
 
 # LangChain / Google Gemini 설정
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.callbacks import UsageMetadataCallbackHandler
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 # LangGraph 핵심 모듈
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Send
+from langgraph.runtime import Runtime
 
 # 환경 변수 로드 (.env 파일 필요)
 load_dotenv()
@@ -59,6 +65,8 @@ class GradeResult(BaseModel):
     score: int = Field(..., description="학생 점수 (0-100)")
     feedback: str = Field(..., description="학생에게 줄 피드백")
     is_correct: bool
+    # 예산 소진으로 채점하지 못한 항목 표시 (LLM 출력 스키마에는 넣지 않음)
+    budget_stopped: SkipJsonSchema[bool] = False
 
 # [검토용] 채점 품질 평가표 (Pass/Fail 대신 점수 사용)
 class ReviewResult(BaseModel):
@@ -66,6 +74,155 @@ class ReviewResult(BaseModel):
     critique: str = Field(..., description="채점에 대한 평가 및 개선 요구사항")
 
 
+# -------------------------------------
+# 1-1. 예산 관리자 (모든 워커가 공유)
+# -------------------------------------
+# app.invoke(inputs, context=GradingBudget(...)) 로 넘기면
+# 채점(grade) + 검토(review) 루프 전체가 하나의 예산을 나눠 씁니다.
+# 예산이 부족해지면 품질 점수가 가장 낮은(= 통과까지 가장 먼) 루프부터 멈춥니다.
+# context 없이 실행하면 예산 없이 기존과 동일하게 동작합니다.
+
+class GradingBudget:
+    def __init__(self, max_llm_calls: Optional[int] = None, max_tokens: Optional[int] = None,
+                 max_seconds: Optional[float] = None):
+        self.max_llm_calls = max_llm_calls
+        self.max_tokens = max_tokens
+        self.max_seconds = max_seconds
+        self.started = time.monotonic()
+        self.calls = 0
+        self.tokens = 0
+        self.reserved = {}              # 워커 → 허락받았지만 아직 안 쓴 LLM 호출 수
+        self.usage = {}                 # 워커별 사용량
+        self.active = set()             # 채점 루프가 끝나지 않은 워커
+        self.quality = {}               # 재채점을 기다리는 워커 → 최근 품질 점수
+        self.decisions = {}             # 한꺼번에 내린 재채점 결정 (워커 → (허용 여부, 중단 이유))
+        self._cond = threading.Condition()
+
+    def _worker(self, worker: str) -> dict:
+        return self.usage.setdefault(worker, {"calls": 0, "tokens": 0, "seconds": 0.0, "loops": 0, "status": "-"})
+
+    def exhausted(self) -> Optional[str]:
+        """예산이 다 떨어졌으면 이유, 아니면 None"""
+        if self.max_llm_calls is not None and self.calls >= self.max_llm_calls:
+            return "LLM 호출"
+        if self.max_tokens is not None and self.tokens >= self.max_tokens:
+            return "토큰"
+        if self.max_seconds is not None and time.monotonic() - self.started >= self.max_seconds:
+            return "시간"
+        return None
+
+    def _affordable_loops(self) -> float:
+        """남은 예산(이미 허락한 호출 제외)으로 더 돌 수 있는 루프(채점 + 검토 = 호출 2번) 수"""
+        loops = float("inf")
+        reserved = sum(self.reserved.values())
+        if self.max_llm_calls is not None:
+            loops = min(loops, (self.max_llm_calls - self.calls - reserved) // 2)
+        if self.max_tokens is not None and self.calls:
+            per_call = self.tokens / self.calls
+            if per_call:
+                loops = min(loops, (self.max_tokens - self.tokens - reserved * per_call) // (2 * per_call))
+        if self.max_seconds is not None:
+            done = [u["seconds"] / u["loops"] for u in self.usage.values() if u["loops"]]
+            if done and time.monotonic() - self.started + max(done) > self.max_seconds:
+                loops = 0
+        return max(loops, 0)
+
+    def begin(self, worker: str) -> bool:
+        """첫 채점 전에 호출: 루프 1번 분량을 예약할 수 있으면 True"""
+        with self._cond:
+            if self.exhausted() or self._affordable_loops() < 1:
+                self._worker(worker)["status"] = "예산 소진으로 생략"
+                return False
+            self.active.add(worker)
+            self.reserved[worker] = 2
+            self._worker(worker)["status"] = "진행 중"
+            return True
+
+    def invoke(self, worker: str, runnable, prompt):
+        """runnable.invoke + 호출 수 / 토큰 / 시간 기록"""
+        handler = UsageMetadataCallbackHandler()
+        start = time.monotonic()
+        try:
+            return runnable.invoke(prompt, config={"callbacks": [handler]})
+        except Exception:
+            self.finish(worker, "오류")  # 다른 워커가 이 워커의 결정을 기다리지 않도록
+            raise
+        finally:
+            tokens = sum(u.get("total_tokens", 0) for u in handler.usage_metadata.values())
+            with self._cond:
+                self.calls += 1
+                self.tokens += tokens
+                if self.reserved.get(worker):
+                    self.reserved[worker] -= 1
+                usage = self._worker(worker)
+                usage["calls"] += 1
+                usage["tokens"] += tokens
+                usage["seconds"] += time.monotonic() - start
+
+    def can_retry(self, worker: str, quality: int) -> bool:
+        """한 번 더 루프를 돌아도 되는지
+
+        예산이 넉넉하면 바로 허용. 부족하면 돌고 있는 워커가 모두 이 지점에 올 때까지 기다렸다가
+        품질 점수가 높은(= 통과에 가까운) 워커부터 남은 예산만큼만 허용하고 나머지는 멈춥니다.
+        """
+        with self._cond:
+            self._worker(worker)["loops"] += 1
+            self.quality[worker] = quality
+            self._cond.notify_all()
+
+            while worker not in self.decisions:
+                affordable = self._affordable_loops()
+                if self.exhausted() or not affordable:
+                    reason = self.exhausted() or "남은 예산 부족"
+                    self.decisions.update({w: (False, reason) for w in self.quality})
+                elif affordable >= len(self.active):
+                    self.decisions[worker] = (True, None)
+                elif set(self.quality) >= self.active:
+                    ranking = sorted(self.quality, key=lambda w: -self.quality[w])
+                    self.decisions.update({w: (i < affordable, "우선순위 밀림") for i, w in enumerate(ranking)})
+                else:
+                    self._cond.wait(0.5)  # 다른 워커의 검토 결과를 기다림
+                    continue
+                for w, (ok, _) in self.decisions.items():
+                    if self.quality.pop(w, None) is not None and ok:
+                        self.reserved[w] = 2  # 허락한 루프 1번 분량을 바로 예약
+                self._cond.notify_all()
+
+            allowed, reason = self.decisions.pop(worker)
+            if not allowed:
+                self._finish(worker, f"예산 중단 ({reason})")
+            return allowed
+
+    def _finish(self, worker: str, status: str):
+        self.active.discard(worker)
+        self.quality.pop(worker, None)
+        self.reserved.pop(worker, None)
+        self._worker(worker)["status"] = status
+        self._cond.notify_all()  # 이 워커를 기다리던 결정이 진행되도록
+
+    def finish(self, worker: str, status: str):
+        with self._cond:
+            self._worker(worker)["loops"] += 1
+            self._finish(worker, status)
+
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.started
+        lines = [f"[예산] LLM 호출 {self.calls}/{self.max_llm_calls or '∞'}, "
+                 f"토큰 {self.tokens}/{self.max_tokens or '∞'}, "
+                 f"시간 {elapsed:.1f}/{self.max_seconds or '∞'}s"]
+        for worker, u in sorted(self.usage.items()):
+            lines.append(f"   └ {worker}: 루프 {u['loops']}회, 호출 {u['calls']}회, 토큰 {u['tokens']}, "
+                         f"{u['seconds']:.1f}s, {u['status']}")
+        return "\n".join(lines)
+
+
+def invoke_llm(runtime: Runtime[GradingBudget], worker: str, runnable, prompt):
+    """예산이 있으면 사용량을 기록하면서, 없으면 그냥 호출"""
+    if runtime.context is None:
+        return runnable.invoke(prompt)
+    return runtime.context.invoke(worker, runnable, prompt)
+
+
 # -------------------------------------
 # 2. SubGraph (Worker) 정의
 # -------------------------------------
@@ -73,6 +230,7 @@ class ReviewResult(BaseModel):
 # [Worker State]
 class WorkerState(TypedDict):
     # 입력
+    worker_id: str                      # 예산 리포트용 이름 (번호. 과목)
     subject: str
     student_answer: str
 
@@ -80,13 +238,20 @@ class WorkerState(TypedDict):
     grade_result: Optional[GradeResult] # 채점 결과
     review_critique: Optional[str]      # 검토 피드백
     retry_count: int                    # 재시도 횟수
+    budget_stopped: bool                # 예산이 없어 채점을 건너뛰었는지
 
     # [BRIDGE] 출력 (메인 그래프로 전달될 데이터)
     # operator.add를 통해 메인 그래프의 리스트에 자동으로 합류합니다.
     final_grades: Annotated[List[GradeResult], operator.add]
 
 # [Node: Grader] 채점 선생님
-def node_grade(state: WorkerState):
+def node_grade(state: WorkerState, runtime: Runtime[GradingBudget]):
+    # 첫 채점 전에 예산이 이미 바닥났으면 채점하지 않음 (성적표에는 "미채점", 총점에서 제외)
+    if runtime.context is not None and state["retry_count"] == 0 and not runtime.context.begin(state["worker_id"]):
+        print(f"    ⛔ [{state['subject']}] 예산 소진으로 채점 생략")
+        skipped = GradeResult(subject=state["subject"], score=0, feedback="예산 소진으로 채점하지 못했습니다.", is_correct=False, budget_stopped=True)
+        return {"grade_result": skipped, "budget_stopped": True}
+
     print(f"    ✍️ [{state['subject']}] 채점 중... (시도: {state['retry_count'] + 1}회)")
 
     grader = llm.with_structured_output(GradeResult)
@@ -97,13 +262,16 @@ def node_grade(state: WorkerState):
     if state.get("review_critique"):
         prompt += f"\n\n[지적사항]: '{state['review_critique']}'\n위 지적을 반영하여 채점을 수정하세요."
 
-    result = grader.invoke(prompt)
+    result = invoke_llm(runtime, state["worker_id"], grader, prompt)
     result.subject = state['subject'] # 과목명 유지
 
     return {"grade_result": result, "retry_count": state["retry_count"] + 1}
 
 # [Node: Reviewer] 품질 관리자 (점수 기반 평가)
-def node_review(state: WorkerState):
+def node_review(state: WorkerState, runtime: Runtime[GradingBudget]):
+    if state.get("budget_stopped"):
+        return {}
+
     print(f"      🔎 [{state['subject']}] 채점 품질 심사 중...")
 
     reviewer = llm.with_structured_output(ReviewResult)
@@ -124,7 +292,7 @@ def node_review(state: WorkerState):
     채점이 정확하고 피드백이 적절하면 높은 점수(90 이상),
     오류가 있거나 피드백이 부실하면 낮은 점수를 부여하세요.
     """
-    review = reviewer.invoke(prompt)
+    review = invoke_llm(runtime, state["worker_id"], reviewer, prompt)
 
     print(f"      👉 품질 점수: {review.quality_score}점 / 코멘트: {review.critique}")
     return {"review_critique": review.critique, "last_quality_score": review.quality_score}
@@ -135,7 +303,7 @@ def node_report(state: WorkerState):
     return {"final_grades": [state["grade_result"]]}
 
 # [Edge Logic] 점수 기반 루프 결정
-def loop_decision(state: WorkerState):
+def loop_decision(state: WorkerState, runtime: Runtime[GradingBudget]):
     # 품질 점수를 가져옵니다 (node_review에서 state에 넣었다고 가정하거나, 직전 invoke 결과 활용)
     # 여기서는 편의상 node_review가 반환한 값을 state에 'last_quality_score'로 저장했다고 가정하고 꺼냅니다.
     # (실제 런타임에서는 ReviewResult를 state에 저장하는 것이 정석이나, 간단히 로직만 구현)
@@ -145,12 +313,22 @@ def loop_decision(state: WorkerState):
     # *위 node_review에서 last_quality_score를 반환했으므로 state에 들어옵니다 (TypedDict에 추가 필요).*
 
     quality = state.get("last_quality_score", 0)
+    budget = runtime.context
+
+    if state.get("budget_stopped"):
+        return "pass"
 
     # 기준: 품질 80점 이상이면 통과 OR 3번 시도했으면 강제 통과
     if quality >= 80 or state["retry_count"] >= 3:
+        if budget is not None:
+            budget.finish(state["worker_id"], "통과" if quality >= 80 else "최대 시도")
+        return "pass"
+
+    # 공용 예산이 부족하면 가망이 낮은 루프부터 현재 결과로 종료
+    if budget is not None and not budget.can_retry(state["worker_id"], quality):
+        print(f"      ⛔ [{state['subject']}] 예산 부족으로 재채점 중단 (품질 {quality}점)")
         return "pass"
-    else:
-        return "retry"
+    return "retry"
 
 # State에 품질 점수 필드 추가 (동적 업데이트를 위해)
 WorkerState.__annotations__["last_quality_score"] = int
@@ -190,14 +368,14 @@ class MainState(TypedDict):
     final_report: str
 
 # [Node: Parse]
-def node_parse(state: MainState):
+def node_parse(state: MainState, runtime: Runtime[GradingBudget]):
     print("\n🧐 [Head Teacher] 답안지 스캔 및 과목 분류 중...")
     parser = llm.with_structured_output(ParsedExam)
-    result = parser.invoke(f"다음 내용을 과목별로 분리해줘:\n{state['raw_text']}")
+    result = invoke_llm(runtime, "0. 답안지 분류", parser, f"다음 내용을 과목별로 분리해줘:\n{state['raw_text']}")
     return {"parsed_sheets": result.sheets}
 
 # [Node: Compile]
-def node_compile(state: MainState):
+def node_compile(state: MainState, runtime: Runtime[GradingBudget]):
     print("\n🖨️ [System] 최종 성적표 출력 중...")
     grades = state['final_grades']
 
@@ -207,30 +385,42 @@ def node_compile(state: MainState):
     # 보기 좋게 정렬 (과목명 기준)
     sorted_grades = sorted(grades, key=lambda x: x.subject)
 
+    graded = 0
     for g in sorted_grades:
+        # 예산 소진으로 채점하지 않은 항목은 0점이 아니라 미채점 (총점/만점 모두에서 제외)
+        if g.budget_stopped:
+            report += f"\n⏸️ [{g.subject}] 미채점\n   └ {g.feedback}\n"
+            continue
         icon = "✅" if g.score >= 60 else "⚠️" # 60점 기준 과락 표시
         report += f"\n{icon} [{g.subject}] {g.score}점\n   └ 피드백: {g.feedback}\n"
         total_score += g.score
+        graded += 1
 
-    report += f"\n{'='*40}\n총점: {total_score} / {len(grades)*100} 점"
+    report += f"\n{'='*40}\n총점: {total_score} / {graded*100} 점"
+    if graded < len(grades):
+        report += f" (미채점 {len(grades) - graded}과목 제외)"
+    if runtime.context is not None:
+        report += "\n\n" + runtime.context.report()
     return {"final_report": report}
 
 # [Edge Logic: Map]
 def map_workers(state: MainState):
     return [
         Send("grading_worker", {
+            "worker_id": f"{i}. {s.subject}",
             "subject": s.subject,
             "student_answer": s.student_answer,
             "retry_count": 0,
             "grade_result": None,
             "review_critique": None,
+            "budget_stopped": False,
             "final_grades": [] # 초기화
         })
-        for s in state['parsed_sheets']
+        for i, s in enumerate(state['parsed_sheets'], start=1)
     ]
 
 # [Main Graph Build]
-workflow = StateGraph(MainState)
+workflow = StateGraph(MainState, context_schema=GradingBudget)
 
 workflow.add_node("parse", node_parse)
 workflow.add_node("grading_worker", grading_worker) # 컴파일된 서브그래프 사용
@@ -256,8 +446,9 @@ if __name__ == "__main__":
     inputs = {"raw_text": STUDENT_DRAFT, "final_grades": []}
 
     try:
-        # 실행
-        result = app.invoke(inputs)
+        # 실행 (전체 예산: LLM 호출 20회, 토큰 30,000개, 2분)
+        budget = GradingBudget(max_llm_calls=20, max_tokens=30_000, max_seconds=120)
+        result = app.invoke(inputs, context=budget)
 
         # 최종 결과 출력
         print("\n" + result["final_report"])
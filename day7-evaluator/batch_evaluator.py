@@ -0,0 +1,133 @@
+#-------------------------------------
+# Batch evaluator: 농담 여러 개를 구조화 출력 호출 한 번으로 평가
+#-------------------------------------
+"""
+example.py 의 evaluator.invoke(f"Grade the joke {joke}") 는 호출 1번에 농담 1개.
+best-of-N 루프나 저장해 둔 농담을 오프라인으로 평가할 때는 한 번에 여러 개를 보낸다.
+
+- 농담마다 번호를 붙여 보내고, 결과는 번호(index)로 다시 맞춘다
+- 형식이 잘못된 항목(스키마 오류, 빠진 번호, 중복 번호)만 하나씩 다시 평가
+  (전체 파싱이 실패해도 raw tool call에서 올바른 항목은 살려서 씀)
+- 하나씩 다시 평가한 것도 실패(예외, None)하면 REGRADE_ATTEMPTS 번까지 재시도,
+  그래도 안 되면 RuntimeError (None이나 예외 객체를 평가 결과로 돌려주지 않음)
+- 스키마는 Feedback 기본, best_of_n.py 처럼 Feedback을 확장한 스키마도 사용 가능
+
+    grades = batch_grade(["joke 1", "joke 2", "joke 3"])  # → [Feedback, Feedback, Feedback]
+
+python batch_evaluator.py jokes.jsonl --batch-size 10   # 저장된 농담 오프라인 평가
+"""
+
+from pydantic import Field, ValidationError, create_model
+
+from example import llm, Feedback
+
+grading_calls = 0  # 평가에 쓴 LLM 호출 수
+REGRADE_ATTEMPTS = 2  # 하나씩 다시 평가할 때 항목당 최대 시도 횟수
+
+_batch_evaluators = {}  # schema → (번호가 붙은 항목 스키마, 구조화 출력 runnable)
+
+
+def _batch_evaluator(schema):
+    if schema not in _batch_evaluators:
+        item = create_model(
+            f"Indexed{schema.__name__}",
+            __base__=schema,
+            index=(int, Field(description="The number of the joke being graded.")),
+        )
+        batch = create_model(
+            f"{schema.__name__}Batch",
+            grades=(list[item], Field(description="Exactly one grade for every numbered joke.")),
+        )
+        _batch_evaluators[schema] = (item, llm.with_structured_output(batch, include_raw=True))
+    return _batch_evaluators[schema]
+
+
+def _raw_items(result) -> list:
+    """Grade entries as returned by the model, even if the batch failed to parse"""
+    if result["parsed"] is not None:
+        return list(result["parsed"].grades)
+    for call in getattr(result["raw"], "tool_calls", None) or []:
+        grades = call["args"].get("grades")
+        if isinstance(grades, list):
+            return grades
+    return []
+
+
+def batch_grade(jokes: list[str], schema=Feedback) -> list:
+    """One ``schema`` grade per joke, in input order, from a single structured-output call"""
+    global grading_calls
+
+    if not jokes:
+        return []
+    item, evaluator = _batch_evaluator(schema)
+
+    numbered = "\n\n".join(f"[{i}]\n{joke}" for i, joke in enumerate(jokes))
+    grades = {}
+    try:
+        grading_calls += 1
+        result = evaluator.invoke(
+            "Grade each of the numbered jokes below. "
+            "Return exactly one grade per joke and set index to the joke's number.\n\n" + numbered
+        )
+        for entry in _raw_items(result):
+            try:
+                graded = entry if isinstance(entry, item) else item.model_validate(entry)
+            except ValidationError:
+                continue  # 이 항목만 형식 오류
+            if 0 <= graded.index < len(jokes) and graded.index not in grades:
+                grades[graded.index] = schema.model_validate(graded.model_dump(exclude={"index"}))
+    except Exception as e:  # 호출 자체가 실패
+        print(f"[BATCH EVALUATOR] {len(jokes)}개 평가 실패: {e!r}")
+
+    # 형식이 잘못됐거나 빠진 항목만 하나씩 다시 평가 (한 항목 실패가 나머지를 막지 않도록 return_exceptions)
+    single = llm.with_structured_output(schema)
+    errors = {}
+    for _ in range(REGRADE_ATTEMPTS):
+        malformed = [i for i in range(len(jokes)) if i not in grades]
+        if not malformed:
+            break
+        print(f"[BATCH EVALUATOR] 다시 평가: {malformed}")
+        grading_calls += len(malformed)
+        regraded = single.batch([f"Grade the joke {jokes[i]}" for i in malformed], return_exceptions=True)
+        for i, result in zip(malformed, regraded):
+            if isinstance(result, schema):
+                grades[i] = result
+            else:
+                errors[i] = result  # 예외 또는 파싱 실패(None)
+
+    missing = [i for i in range(len(jokes)) if i not in grades]
+    if missing:
+        details = ", ".join(f"{i}: {errors.get(i)!r}" for i in missing)
+        raise RuntimeError(f"{REGRADE_ATTEMPTS}번 다시 평가해도 실패한 농담 {missing} ({details})")
+
+    return [grades[i] for i in range(len(jokes))]
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Grade stored jokes in batches")
+    parser.add_argument("path", help="농담 파일 (JSONL의 joke 필드 또는 한 줄에 농담 하나)")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--output", default=None, help="평가 결과 JSONL (기본: <path>.grades.jsonl)")
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    jokes = [json.loads(line)["joke"] if line.startswith("{") else line for line in lines]
+
+    start = time.perf_counter()
+    funny = 0
+    with open(args.output or f"{args.path}.grades.jsonl", "w", encoding="utf-8") as out:
+        for offset in range(0, len(jokes), args.batch_size):
+            chunk = jokes[offset:offset + args.batch_size]
+            for joke, grade in zip(chunk, batch_grade(chunk)):
+                funny += grade.grade == "funny"
+                out.write(json.dumps({"joke": joke, **grade.model_dump()}, ensure_ascii=False) + "\n")
+
+    print(
+        f"농담 {len(jokes)}개 평가: funny {funny}개 / LLM 호출 {grading_calls}회 "
+        f"(농담당 1회였다면 {len(jokes)}회) / {time.perf_counter() - start:.1f}s"
+    )
@@ -0,0 +1,175 @@
+#-------------------------------------
+# Best-of-N: 라운드마다 후보 N개를 동시에 만들고, 함께 평가해서 가장 좋은 것으로 이어가기
+#-------------------------------------
+"""
+example.py 는 라운드마다 농담 1개 생성 → 1개 평가 → 최대 3라운드.
+가장 나쁜 경우 LLM 왕복 6번이 순서대로 이어진다.
+
+여기서는 한 라운드에
+- llm_call_generator : 같은 프롬프트로 후보 N개를 동시에 생성 (llm.batch)
+- llm_call_evaluator : N개를 구조화 출력 호출 한 번으로 평가하고 (batch_evaluator.py)
+                       가장 좋은 후보(funny 우선, 그다음 score)를 고름
+- 다음 라운드는 가장 좋은 후보의 피드백을 반영해서 다시 N개 생성
+라운드 하나의 지연 시간은 example.py 의 1라운드와 거의 같고, 통과까지 필요한 라운드 수는 줄어든다.
+
+python best_of_n.py --fake --runs 20 --n 4   # 기존 루프와 라운드 수 / 시간 비교
+"""
+
+from pydantic import Field
+from langgraph.graph import StateGraph, START, END
+
+from example import llm, State, Feedback, route_joke
+from batch_evaluator import batch_grade
+
+
+# 후보끼리 비교할 수 있도록 점수를 추가한 평가 스키마
+class RankedFeedback(Feedback):
+    score: int = Field(description="Rate how funny the joke is from 1 (not funny) to 10 (very funny).")
+
+
+# Graph state
+class BestOfNState(State):
+    n: int  # 라운드당 후보 수
+    candidates: list[str]  # 이번 라운드 후보
+    grades: list[RankedFeedback]  # 후보별 평가
+
+
+def best_index(grades: list[RankedFeedback]) -> int:
+    """Index of the best candidate: funny first, then the highest score"""
+    return max(range(len(grades)), key=lambda i: (grades[i].grade == "funny", grades[i].score))
+
+
+# 노드 1: llm_call_generator (후보 N개 동시 생성)
+def llm_call_generator(state: BestOfNState):
+    """LLM generates N candidate jokes concurrently"""
+
+    attempts = (state.get("attempts") or 0) + 1
+    n = state.get("n") or 3
+
+    if state.get("feedback"):
+        prompt = f"Write a joke about {state['topic']} but take into account the feedback: {state['feedback']}"
+    else:
+        prompt = f"Write a joke about {state['topic']}"
+    messages = llm.batch([prompt] * n, config={"max_concurrency": n})
+
+    print(f"[GENERATE] Round {attempts}: 후보 {n}개\n")
+    return {"candidates": [m.content for m in messages], "attempts": attempts}
+
+
+# 노드 2: llm_call_evaluator (후보를 함께 평가하고 가장 좋은 것 선택)
+def llm_call_evaluator(state: BestOfNState):
+    """LLM grades every candidate; the loop continues from the best one"""
+
+    candidates = state["candidates"]
+    grades = batch_grade(candidates, RankedFeedback)
+    best = best_index(grades)
+
+    summary = ", ".join(f"{g.grade}({g.score})" for g in grades)
+    print(f"[EVALUATE] Round {state['attempts']}: {summary} → 후보 {best + 1} 선택\n")
+
+    return {
+        "grades": grades,
+        "joke": candidates[best],
+        "funny_or_not": grades[best].grade,
+        "feedback": grades[best].feedback,
+    }
+
+
+# Build workflow (구조는 example.py와 동일, 라우팅 함수도 그대로 사용)
+best_of_n_builder = StateGraph(BestOfNState)
+
+best_of_n_builder.add_node("llm_call_generator", llm_call_generator)
+best_of_n_builder.add_node("llm_call_evaluator", llm_call_evaluator)
+
+best_of_n_builder.add_edge(START, "llm_call_generator")
+best_of_n_builder.add_edge("llm_call_generator", "llm_call_evaluator")
+best_of_n_builder.add_conditional_edges(
+    "llm_call_evaluator",
+    route_joke,
+    {
+        "Accepted": END,
+        "Rejected + Feedback": "llm_call_generator",
+    },
+)
+
+best_of_n_workflow = best_of_n_builder.compile()
+
+
+if __name__ == "__main__":
+    import argparse
+    import contextlib
+    import io
+    import random
+    import statistics
+    import time
+
+    import example
+
+    parser = argparse.ArgumentParser(description="Single-candidate loop vs best-of-N loop")
+    parser.add_argument("--fake", action="store_true", help="가짜 모델 사용 (API 호출 없음)")
+    parser.add_argument("--latency", type=float, default=0.5)  # 가짜 모델 호출 1번 지연(초)
+    parser.add_argument("--funny-rate", type=float, default=0.3)  # 가짜 평가자가 funny를 줄 확률
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--n", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.fake:
+        from langchain_core.language_models import BaseChatModel
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, ChatResult
+        from langchain_core.runnables import RunnableLambda
+
+        class FakeLatencyChatModel(BaseChatModel):
+            latency: float
+
+            @property
+            def _llm_type(self) -> str:
+                return "fake-latency"
+
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                time.sleep(self.latency)
+                joke = f"joke #{random.randrange(10_000)}"
+                return ChatResult(generations=[ChatGeneration(message=AIMessage(content=joke))])
+
+        def fake_feedback():
+            funny = random.random() < args.funny_rate
+            return RankedFeedback(
+                grade="funny" if funny else "not funny",
+                feedback="" if funny else "Make the punchline shorter.",
+                score=random.randint(7, 10) if funny else random.randint(1, 6),
+            )
+
+        def fake_grade(prompt):
+            time.sleep(args.latency)
+            return fake_feedback()
+
+        def fake_batch_grade(jokes, schema=Feedback):
+            time.sleep(args.latency)  # 후보 수와 상관없이 호출 1번
+            return [fake_feedback() for _ in jokes]
+
+        # 두 그래프의 노드가 모두 가짜 모델을 보도록 교체
+        llm = example.llm = FakeLatencyChatModel(latency=args.latency)
+        example.evaluator = RunnableLambda(fake_grade)
+        batch_grade = fake_batch_grade
+
+    def run(workflow, inputs):
+        rounds, accepted, seconds = [], 0, []
+        for i in range(args.runs):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):  # 노드 출력 숨김
+                state = workflow.invoke({**inputs, "topic": f"Cats {i}"})
+            seconds.append(time.perf_counter() - start)
+            rounds.append(state["attempts"])
+            accepted += state["funny_or_not"] == "funny"
+        return rounds, accepted, seconds
+
+    print(f"{'':<14} {'accepted':>9} {'rounds':>7} {'wall p50':>9} {'wall mean':>10}")
+    for name, workflow, inputs in [
+        ("single", example.optimizer_workflow, {}),
+        (f"best-of-{args.n}", best_of_n_workflow, {"n": args.n}),
+    ]:
+        rounds, accepted, seconds = run(workflow, inputs)
+        print(
+            f"{name:<14} {accepted:>4}/{args.runs:<4} {statistics.mean(rounds):>7.2f} "
+            f"{statistics.median(seconds):>8.2f}s {statistics.mean(seconds):>9.2f}s"
+        )
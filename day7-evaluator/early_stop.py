@@ -0,0 +1,120 @@
+#-------------------------------------
+# Early stopping: 후보가 더 이상 바뀌지 않으면 루프를 일찍 끝낸다
+#-------------------------------------
+"""
+example.py 의 route_joke는 "funny" 이거나 attempts >= 3 일 때만 멈춘다.
+생성기가 같은 농담을 조금씩만 바꿔 내거나 평가자가 같은 피드백을 반복하면
+남은 라운드는 토큰과 시간만 쓴다.
+
+멈추는 조건 (stop_reason 으로 state에 남김)
+- accepted          : funny 판정
+- max_attempts      : MAX_ATTEMPTS 회 시도
+- converged         : 직전 농담과의 정규화 편집 거리 < MIN_JOKE_CHANGE (평가 호출도 생략)
+- feedback_repeated : 직전 피드백과의 정규화 편집 거리 < MIN_FEEDBACK_CHANGE
+"""
+
+import re
+
+from langgraph.graph import StateGraph, START, END
+
+from example import State, llm_call_generator, llm_call_evaluator
+
+MAX_ATTEMPTS = 3
+MIN_JOKE_CHANGE = 0.15  # 농담이 15% 미만으로 바뀌면 수렴으로 봄
+MIN_FEEDBACK_CHANGE = 0.2  # 피드백이 20% 미만으로 바뀌면 반복으로 봄
+
+
+def normalized_edit_distance(a: str, b: str) -> float:
+    """Levenshtein distance divided by the longer length (0 = same, 1 = completely different)"""
+    a = re.sub(r"\s+", " ", a).strip().casefold()
+    b = re.sub(r"\s+", " ", b).strip().casefold()
+    if not a and not b:
+        return 0.0
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1] / len(a)
+
+
+# Graph state (직전 결과 + 멈춘 이유 추가)
+class ConvergenceState(State):
+    previous_joke: str  # 직전 라운드 농담
+    previous_feedback: str  # 직전 라운드 피드백
+    stop_reason: str  # 루프를 멈춘 이유 (계속 진행 중이면 "")
+
+
+# 노드 1: llm_call_generator (example.py 생성기 + 직전 농담 보관)
+def generator(state: ConvergenceState):
+    """LLM generates a joke; the previous one is kept for comparison"""
+    return {**llm_call_generator(state), "previous_joke": state.get("joke") or ""}
+
+
+# 노드 2: llm_call_evaluator (example.py 평가자 + 멈출지 판단)
+def evaluator(state: ConvergenceState):
+    """LLM evaluates the joke, then decides whether the loop has converged"""
+
+    previous_feedback = state.get("feedback") or ""  # 생성기는 feedback을 지우지 않으므로 직전 라운드 값
+
+    # 농담이 거의 안 바뀌었으면 평가할 필요도 없음 (직전 판정 유지)
+    if state.get("previous_joke"):
+        joke_change = normalized_edit_distance(state["joke"], state["previous_joke"])
+        if joke_change < MIN_JOKE_CHANGE:
+            print(f"[CONVERGENCE] 농담 변화 {joke_change:.2f} → 평가 생략\n")
+            return {"previous_feedback": previous_feedback, "stop_reason": "converged"}
+
+    update = llm_call_evaluator(state)
+
+    stop_reason = ""
+    if update["funny_or_not"] == "funny":
+        stop_reason = "accepted"
+    elif state["attempts"] >= MAX_ATTEMPTS:
+        stop_reason = "max_attempts"
+    elif state.get("previous_joke"):
+        feedback_change = normalized_edit_distance(update["feedback"], previous_feedback)
+        if feedback_change < MIN_FEEDBACK_CHANGE:
+            stop_reason = "feedback_repeated"
+        print(f"[CONVERGENCE] 피드백 변화 {feedback_change:.2f}\n")
+
+    return {**update, "previous_feedback": previous_feedback, "stop_reason": stop_reason}
+
+
+# 라우팅 함수
+def route_joke(state: ConvergenceState):
+    """Stop when accepted, out of attempts, or when successive rounds stop changing"""
+
+    if state["stop_reason"]:
+        print(f"[END] {state['stop_reason']} ({state['attempts']}회 시도)")
+        return "Accepted"
+
+    print("[LOOP] 개선 피드백 반영하여 재시도")
+    return "Rejected + Feedback"
+
+
+# Build workflow (구조는 example.py와 동일)
+early_stop_builder = StateGraph(ConvergenceState)
+
+early_stop_builder.add_node("llm_call_generator", generator)
+early_stop_builder.add_node("llm_call_evaluator", evaluator)
+
+early_stop_builder.add_edge(START, "llm_call_generator")
+early_stop_builder.add_edge("llm_call_generator", "llm_call_evaluator")
+early_stop_builder.add_conditional_edges(
+    "llm_call_evaluator",
+    route_joke,
+    {
+        "Accepted": END,
+        "Rejected + Feedback": "llm_call_generator",
+    },
+)
+
+early_stop_workflow = early_stop_builder.compile()
+
+
+if __name__ == "__main__":
+    state = early_stop_workflow.invoke({"topic": "Cats"})
+    print(f"\n{state['joke']}\n\n시도 {state['attempts']}회 / 멈춘 이유: {state['stop_reason']}")
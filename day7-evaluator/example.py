@@ -115,10 +115,11 @@ optimizer_builder.add_conditional_edges(
 # Compile the workflow
 optimizer_workflow = optimizer_builder.compile()
 
-# Show the workflow
-print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
-print(optimizer_workflow.get_graph(xray=True).draw_mermaid())
-
-# Invoke
-state = optimizer_workflow.invoke({"topic": "Cats"})
-print(state["joke"])
\ No newline at end of file
+if __name__ == "__main__":
+    # Show the workflow
+    print("Here is the mermaid graph syntax. You can paste it into https://mermaid.live/ :") #사이트 들어가서 코드 붙여넣기
+    print(optimizer_workflow.get_graph(xray=True).draw_mermaid())
+
+    # Invoke
+    state = optimizer_workflow.invoke({"topic": "Cats"})
+    print(state["joke"])
\ No newline at end of file
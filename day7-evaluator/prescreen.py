@@ -0,0 +1,162 @@
+#-------------------------------------
+# Pre-screen: LLM 평가자 앞에서 빠르고 결정적인 검사로 먼저 걸러내기
+#-------------------------------------
+"""
+평가-개선 루프에서 탈락하는 후보 중에는 LLM에게 물어볼 필요도 없는 것이 많다.
+- 빈 출력
+- 너무 긴 출력
+- 이전 시도와 (거의) 똑같은 출력
+- 꼭 들어가야 할 키워드가 없는 출력
+
+검사(check)는 (후보 텍스트, state) → 탈락 사유(str) 또는 None 을 돌려주는 함수.
+하나라도 걸리면 evaluator를 부르지 않고 탈락 판정 + 피드백을 바로 만들어 준다.
+걸러낸 수 = 아낀 LLM 평가 호출 수 (PreScreen.saved_calls)
+
+    screen = PreScreen([not_empty(), max_length(600), not_repeated()])
+    node = prescreened(screen, llm_call_evaluator, "joke", "funny_or_not", "not funny")
+"""
+
+import difflib
+import operator
+import re
+from collections import Counter
+from typing import Annotated, Callable
+
+from langgraph.graph import StateGraph, START, END
+
+from example import State, llm_call_generator, llm_call_evaluator, route_joke
+
+Check = Callable[[str, dict], str | None]
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+# 검사 만들기
+def not_empty(min_chars: int = 1) -> Check:
+    def empty(text, state):
+        if len(text.strip()) < min_chars:
+            return "The output is empty. Write an actual joke."
+    return empty
+
+
+def max_length(limit: int) -> Check:
+    def too_long(text, state):
+        if len(text) > limit:
+            return f"The output is too long ({len(text)} chars). Keep it under {limit} characters."
+    return too_long
+
+
+def not_repeated(threshold: float = 0.9, history_key: str = "history") -> Check:
+    """Reject candidates that are (almost) the same as a previous attempt"""
+    def repeated(text, state):
+        current = _normalize(text)
+        for previous in state.get(history_key) or []:
+            if difflib.SequenceMatcher(None, current, _normalize(previous)).ratio() >= threshold:
+                return "This is the same as a previous attempt. Try a clearly different joke."
+    return repeated
+
+
+def required_keywords(*keywords: str) -> Check:
+    def missing_keywords(text, state):
+        lowered = text.casefold()
+        missing = [k for k in keywords if k.casefold() not in lowered]
+        if missing:
+            return f"The output must mention: {', '.join(missing)}."
+    return missing_keywords
+
+
+def mentions_topic(topic_key: str = "topic") -> Check:
+    """Opt-in: at least one topic word appears (plural 's' ignored)
+
+    기본 검사에는 넣지 않음 (topic "Cats" 에 "kitten" 만 나오는 농담도 탈락시키므로)
+    """
+    def off_topic(text, state):
+        words = [w.rstrip("s") for w in re.findall(r"\w+", state[topic_key].casefold()) if len(w) >= 3]
+        if words and not any(w in text.casefold() for w in words):
+            return f"The joke is not about {state[topic_key]}."
+    return off_topic
+
+
+class PreScreen:
+    """Runs deterministic checks and counts the evaluator calls they save"""
+
+    def __init__(self, checks: list[Check]):
+        self.checks = checks
+        self.screened = 0  # 검사한 후보 수
+        self.saved_calls = 0  # 탈락시켜서 아낀 evaluator 호출 수
+        self.failures = Counter()  # 검사별 탈락 수
+
+    def screen(self, text: str, state: dict) -> str | None:
+        """Feedback for a rejected candidate, or None if it should go to the evaluator"""
+        self.screened += 1
+        reasons = []
+        for check in self.checks:
+            reason = check(text or "", state)
+            if reason:
+                self.failures[check.__name__] += 1
+                reasons.append(reason)
+        if reasons:
+            self.saved_calls += 1
+            return " ".join(reasons)
+        return None
+
+    def report(self) -> str:
+        rate = self.saved_calls / self.screened if self.screened else 0.0
+        failures = ", ".join(f"{name} {count}" for name, count in self.failures.most_common()) or "-"
+        return f"[PRESCREEN] 후보 {self.screened}개 중 {self.saved_calls}개 사전 탈락 ({rate:.0%}, 아낀 평가 호출 {self.saved_calls}회) / {failures}"
+
+
+def prescreened(screen: PreScreen, evaluator_node, text_key: str, grade_key: str, reject_grade: str, history_key: str = "history"):
+    """Wrap an evaluator node: rejected candidates get synthesized feedback, the rest go to the LLM"""
+
+    def node(state):
+        text = state[text_key]
+        feedback = screen.screen(text, state)
+        if feedback is None:
+            update = evaluator_node(state)
+        else:
+            print(f"[PRESCREEN] {reject_grade}: {feedback}\n")
+            update = {grade_key: reject_grade, "feedback": feedback}
+        return {**update, history_key: [text]}
+
+    node.__name__ = evaluator_node.__name__
+    return node
+
+
+# Graph state (이전 시도 기록 추가)
+class ScreenedState(State):
+    history: Annotated[list[str], operator.add]  # 지금까지 평가한 농담
+
+
+joke_screen = PreScreen([not_empty(), max_length(600), not_repeated()])
+
+# Build workflow (example.py와 동일, evaluator 노드만 사전 검사로 감쌈)
+screened_builder = StateGraph(ScreenedState)
+
+screened_builder.add_node("llm_call_generator", llm_call_generator)
+screened_builder.add_node(
+    "llm_call_evaluator", prescreened(joke_screen, llm_call_evaluator, "joke", "funny_or_not", "not funny")
+)
+
+screened_builder.add_edge(START, "llm_call_generator")
+screened_builder.add_edge("llm_call_generator", "llm_call_evaluator")
+screened_builder.add_conditional_edges(
+    "llm_call_evaluator",
+    route_joke,
+    {
+        "Accepted": END,
+        "Rejected + Feedback": "llm_call_generator",
+    },
+)
+
+screened_workflow = screened_builder.compile()
+
+
+if __name__ == "__main__":
+    for topic in ["Cats", "Dogs", "Coffee"]:
+        state = screened_workflow.invoke({"topic": topic})
+        print(f"{topic}: {state['funny_or_not']} ({state['attempts']}회)\n{state['joke']}\n")
+
+    print(joke_screen.report())
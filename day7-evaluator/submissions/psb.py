@@ -33,6 +33,7 @@ class State(TypedDict):
     feedback: str         # 평가자의 피드백
     grade: str            # 평가 결과 (pass / rewrite)
     attempts: int         # 시도 횟수
+    previous_description: str  # 직전 설명글 (반복 검사용)
 
 # 평가 결과를 구조화할 스키마(Feedback)
 class Feedback(BaseModel):
@@ -105,13 +106,51 @@ def llm_call_generator(state: State):
     return {
         "description": msg.content, 
         "attempts": new_attempts, 
-        "db_data": db_context # DB 정보 저장해두기
+        "db_data": db_context, # DB 정보 저장해두기
+        "previous_description": state.get("description") or "",
     }
 
 
+#-------------------------------------
+# 사전 검사 (LLM 없이도 확실하게 판단되는 실패만 걸러냄)
+#-------------------------------------
+# 첫 문장, 마지막 줄 해시태그, 이모지 7개 규칙은 마크다운(**굵게**, # 제목)이나
+# 합쳐진 이모지(ZWJ, 피부색) 때문에 규칙으로 세면 틀리기 쉬워서 편집장(LLM)에게 맡긴다
+REQUIRED_PHRASE = "지갑 털릴 준비 되셨나요?"
+MAX_LENGTH = 3000
+
+saved_eval_calls = 0  # 사전 검사로 아낀 evaluator 호출 수
+
+
+def prescreen(state: State):
+    """규칙 위반 목록 (비어 있으면 LLM 편집장에게 넘김)"""
+    text = (state.get("description") or "").strip()
+    if not text:
+        return ["설명글이 비어 있습니다."]
+
+    problems = []
+    if len(text) > MAX_LENGTH:
+        problems.append(f"설명글이 너무 깁니다 ({len(text)}자). {MAX_LENGTH}자 이내로 줄이세요.")
+    if text == (state.get("previous_description") or "").strip():
+        problems.append("직전 초안과 똑같습니다. 피드백을 반영해서 실제로 고치세요.")
+    if REQUIRED_PHRASE not in text:
+        problems.append(f'"{REQUIRED_PHRASE}" 문구가 빠졌습니다.')
+    return problems
+
+
 # 노드 2: llm_call_evaluator (평가자)
 def llm_call_evaluator(state: State):
     """작성된 설명글을 깐깐하게 평가합니다."""
+    global saved_eval_calls
+
+    # 확실한 위반(빈 글, 너무 긺, 직전과 같음, 필수 문구 없음)이면 LLM 편집장을 부르지 않고 바로 rewrite
+    problems = prescreen(state)
+    if problems:
+        saved_eval_calls += 1
+        feedback = " ".join(problems)
+        print(f"[EVAL {state['attempts']}] 사전 검사 판정: REWRITE (아낀 평가 호출 {saved_eval_calls}회)")
+        print(f"   🔥 독설 피드백: {feedback}")
+        return {"grade": "rewrite", "feedback": feedback}
 
     prompt = f"""
     당신은 세상에서 가장 성격이 꼬인 악덕 편집장입니다.
@@ -183,4 +222,5 @@ result = optimizer_workflow.invoke({"target_part": "Brick"})
 print("\n" + "="*50)
 print("[최종 결과물]")
 print(result["description"])
+print(f"(사전 검사로 아낀 평가 호출: {saved_eval_calls}회)")
 print("="*50)
\ No newline at end of file
@@ -0,0 +1,208 @@
+#-------------------------------------
+# Delta checkpoint: 계속 늘어나기만 하는 리스트 채널은 "새로 붙은 부분"만 저장
+#-------------------------------------
+"""
+InMemorySaver.put 은 super-step마다 바뀐 채널 값을 통째로 직렬화해서
+blobs[(thread_id, checkpoint_ns, 채널, 버전)] 에 넣는다.
+bar: Annotated[list[str], add] / messages: Annotated[list[dict], operator.add] 처럼
+append만 하는 채널은 길이 n 리스트를 n번 저장 → 스레드 하나에 O(n²) 저장 공간.
+
+DeltaInMemorySaver
+- 저장: 부모 체크포인트의 같은 채널 값이 지금 값의 앞부분(prefix)이면
+        뒤에 붙은 부분(suffix)만 저장하고, blob 자리에는 "delta" 표시만 남김
+- 스냅샷: delta가 snapshot_every(K)번 이어지면 전체 값을 한 번 저장
+          → 읽을 때 따라가는 delta는 최대 K개
+- 읽기: 가장 가까운 스냅샷부터 suffix를 이어 붙여 전체 값을 복원
+        (get_state / get_state_history / replay / update_state 모두 그대로 동작)
+- prefix가 아니면(값을 덮어쓰거나 줄인 경우, 기존 원소를 제자리에서 고친 경우) 그냥 전체 값을 저장
+- 비교와 복원은 항상 저장된 bytes를 다시 풀어서 함 → 그래프가 쓰는 객체와 공유하지 않음
+
+python delta_checkpoint.py --steps 1000 --snapshot-every 50   # 1k-step 스레드 벤치마크
+"""
+
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, get_checkpoint_metadata
+from langgraph.checkpoint.memory import InMemorySaver
+
+DELTA = ("delta", b"")  # blobs에 남기는 표시 (실제 suffix는 self.deltas에)
+
+
+class DeltaInMemorySaver(InMemorySaver):
+    """InMemorySaver that stores append-only list channels as suffixes plus periodic snapshots"""
+
+    def __init__(self, *, delta_channels: set[str] | None = None, snapshot_every: int = 50, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.delta_channels = delta_channels  # None이면 list 값인 채널 모두
+        self.snapshot_every = snapshot_every
+        # (thread_id, ns, 채널, 버전) → (이전 버전, 스냅샷 이후 delta 수, 직렬화한 suffix)
+        self.deltas: dict[tuple, tuple[str, int, tuple[str, bytes]]] = {}
+        self._versions: dict[tuple, ChannelVersions] = {}  # (thread_id, ns, checkpoint_id) → channel_versions
+
+    def _is_delta_channel(self, channel: str, value: Any) -> bool:
+        if not isinstance(value, list):
+            return False
+        return self.delta_channels is None or channel in self.delta_channels
+
+    def _parent_versions(self, thread_id: str, checkpoint_ns: str, parent_id: str | None) -> ChannelVersions:
+        if parent_id is None:
+            return {}
+        key = (thread_id, checkpoint_ns, parent_id)
+        if key not in self._versions:
+            saved = self.storage[thread_id][checkpoint_ns].get(parent_id)
+            self._versions[key] = self.serde.loads_typed(saved[0])["channel_versions"] if saved else {}
+        return self._versions[key]
+
+    def _load_value(self, thread_id: str, checkpoint_ns: str, channel: str, version: str) -> Any:
+        """Rebuild a channel value: nearest snapshot + the suffixes after it"""
+        suffixes = []
+        while (blob := self.blobs[(thread_id, checkpoint_ns, channel, version)]) == DELTA:
+            version, _, suffix = self.deltas[(thread_id, checkpoint_ns, channel, version)]
+            suffixes.append(suffix)
+        value = list(self.serde.loads_typed(blob))
+        for suffix in reversed(suffixes):
+            value.extend(self.serde.loads_typed(suffix))
+        return value
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for k, ver in versions.items():
+            blob = self.blobs.get((thread_id, checkpoint_ns, k, ver))
+            if blob is None or blob[0] == "empty":
+                continue
+            result[k] = self._load_value(thread_id, checkpoint_ns, k, ver) if blob == DELTA else self.serde.loads_typed(blob)
+        return result
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        parent_id = config["configurable"].get("checkpoint_id")
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        parent_versions = self._parent_versions(thread_id, checkpoint_ns, parent_id)
+
+        for k, v in new_versions.items():
+            key = (thread_id, checkpoint_ns, k, v)
+            if k not in values:
+                self.blobs[key] = ("empty", b"")
+                continue
+
+            value = values[k]
+            prev_version = parent_versions.get(k)
+            if self._is_delta_channel(k, value) and prev_version is not None:
+                prev_key = (thread_id, checkpoint_ns, k, prev_version)
+                prev_blob = self.blobs.get(prev_key)
+                if prev_blob is not None and prev_blob[0] != "empty":
+                    previous = self._load_value(thread_id, checkpoint_ns, k, prev_version)
+                    depth = self.deltas[prev_key][1] + 1 if prev_blob == DELTA else 1
+                    if depth <= self.snapshot_every and value[:len(previous)] == previous:
+                        suffix = value[len(previous):]
+                        self.deltas[key] = (prev_version, depth, self.serde.dumps_typed(suffix))
+                        self.blobs[key] = DELTA
+                        continue
+
+            # 스냅샷 (전체 값)
+            self.blobs[key] = self.serde.dumps_typed(value)
+
+        self._versions[(thread_id, checkpoint_ns, checkpoint["id"])] = c["channel_versions"]
+        self.storage[thread_id][checkpoint_ns].update(
+            {
+                checkpoint["id"]: (
+                    self.serde.dumps_typed(c),
+                    self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+                    parent_id,  # parent
+                )
+            }
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        for store in (self.deltas, self._versions):
+            for k in [k for k in store if k[0] == thread_id]:
+                del store[k]
+
+
+def stored_bytes(saver: InMemorySaver, thread_id: str) -> int:
+    """Bytes kept for channel values of a thread (blobs + suffixes; the _versions index is not counted)"""
+    total = sum(len(blob[1]) for key, blob in saver.blobs.items() if key[0] == thread_id)
+    for key, (_, _, suffix) in getattr(saver, "deltas", {}).items():
+        if key[0] == thread_id:
+            total += len(suffix[1])
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+    import operator
+    import time
+    from typing import Annotated
+
+    from typing_extensions import TypedDict
+    from langgraph.graph import StateGraph, START, END
+
+    parser = argparse.ArgumentParser(description="InMemorySaver vs DeltaInMemorySaver on long append-only threads")
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--snapshot-every", type=int, default=50)
+    args = parser.parse_args()
+
+    # example.py 의 messages 채널과 같은 모양 (super-step마다 메시지 1개씩 추가)
+    class State(TypedDict):
+        messages: Annotated[list[dict], operator.add]
+        step: int
+
+    def chat(state: State):
+        step = state["step"] + 1
+        return {"messages": [{"role": "user", "content": f"{step}번째 메시지입니다. " * 4}], "step": step}
+
+    def keep_going(state: State):
+        return "chat" if state["step"] < args.steps else END
+
+    builder = StateGraph(State)
+    builder.add_node("chat", chat)
+    builder.add_edge(START, "chat")
+    builder.add_conditional_edges("chat", keep_going, ["chat", END])
+
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": args.steps + 10}
+    results = {}
+    print(f"{'':<8} {'stored':>10} {'run':>8} {'get_state':>10} {'history':>9}")
+    for name, saver in [
+        ("full", InMemorySaver()),
+        ("delta", DeltaInMemorySaver(snapshot_every=args.snapshot_every)),
+    ]:
+        graph = builder.compile(checkpointer=saver)
+
+        start = time.perf_counter()
+        graph.invoke({"messages": [], "step": 0}, config)
+        run = time.perf_counter() - start
+
+        start = time.perf_counter()
+        latest = graph.get_state(config)
+        get_state = time.perf_counter() - start
+
+        start = time.perf_counter()
+        history = [s.values for s in graph.get_state_history(config)]
+        history_time = time.perf_counter() - start
+
+        results[name] = history
+        print(
+            f"{name:<8} {stored_bytes(saver, '1') / 1e6:>8.2f}MB {run:>7.2f}s "
+            f"{get_state * 1000:>8.2f}ms {history_time:>8.2f}s"
+        )
+        assert len(latest.values["messages"]) == args.steps
+
+    assert results["full"] == results["delta"], "복원한 체크포인트가 다름"
+    print(f"\n체크포인트 {len(results['delta'])}개의 값이 모두 같음 (snapshot_every={args.snapshot_every})")